@@ -0,0 +1,69 @@
+"""Measure the cost of changing the tiles of a 100 by 100 AnimatedGrid. Run
+from the repository root with: python -m benchmarks.animated_grid_tiles
+"""
+from random import Random
+import os
+import time
+
+# Render to memory so the benchmark runs without a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Rect
+
+# The managers have to be imported before the components, as in main.py
+import managers.event_manager
+from managers.asset_manager import AssetManager
+from components.animated_grid import AnimatedGrid
+
+SIZE = 100
+REPEATS = 200
+
+
+def measure(marked: int):
+    """Return the milliseconds taken by set_tiles to mark <marked> tiles of
+    an empty grid, then the microseconds taken by set_tiles, add_tile and
+    remove_tile to change a single tile of that grid.
+    """
+    rng = Random(marked)
+    cells = [(x, y) for y in range(SIZE) for x in range(SIZE)]
+    rng.shuffle(cells)
+    tiles = cells[:marked]
+    others = cells[marked:marked + REPEATS]
+
+    grid = AnimatedGrid(Rect(0, 0, SIZE * 8, SIZE * 8),
+                        folder_path="images/hit",
+                        horizontal_tile_count=SIZE,
+                        vertical_tile_count=SIZE)
+
+    start = time.perf_counter()
+    grid.set_tiles(tiles)
+    fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tile in others:
+        grid.set_tiles(tiles + [tile])
+    grid.set_tiles(tiles)
+    set_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tile in others:
+        grid.add_tile(tile)
+        grid.remove_tile(tile)
+    add_remove = time.perf_counter() - start
+
+    return (fill * 1e3,
+            set_one / (len(others) + 1) * 1e6,
+            add_remove / (2 * len(others)) * 1e6)
+
+
+if __name__ == '__main__':
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((SIZE * 8, SIZE * 8))
+    AssetManager()
+
+    print(f"{'tiles':>8}{'fill ms':>10}{'set us':>10}{'add/rm us':>12}")
+    for marked in (100, 1000, 5000, 9000):
+        fill, set_one, add_remove = measure(marked)
+        print(f"{marked:>8}{fill:>10.1f}{set_one:>10.0f}{add_remove:>12.1f}")
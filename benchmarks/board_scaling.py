@@ -0,0 +1,39 @@
+"""Measure the cost of a shot and the memory of a pair of boards as the board
+grows. Run from the repository root with: python -m benchmarks.board_scaling
+"""
+from random import Random
+import time
+import tracemalloc
+
+from engine.game import DEFAULT_SHIP_LENGTHS, random_fleet
+
+SHOTS = 20000
+
+
+def measure(size: int):
+    """Return the microseconds per shot and the bytes allocated for a board
+    of <size> by <size> taking SHOTS random shots.
+    """
+    rng = Random(size)
+    coordinates = [(rng.randrange(size), rng.randrange(size))
+                   for _ in range(SHOTS)]
+
+    tracemalloc.start()
+    board = random_fleet(size, DEFAULT_SHIP_LENGTHS, rng)
+    start = time.perf_counter()
+    for coordinate in coordinates:
+        board.shoot(coordinate)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return elapsed / SHOTS * 1e6, memory
+
+
+if __name__ == '__main__':
+    print(f"{'size':>8}{'board':>14}{'us/shot':>10}{'KiB':>10}")
+    for size in (10, 32, 100, 1000, 10000, 100000):
+        board = type(random_fleet(size, DEFAULT_SHIP_LENGTHS, Random()))
+        per_shot, memory = measure(size)
+        print(f"{size:>8}{board.__name__:>14}{per_shot:>10.2f}"
+              f"{memory / 1024:>10.0f}")
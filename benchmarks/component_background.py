@@ -0,0 +1,61 @@
+"""Measure the cost of drawing a component with a background image, such as
+the pause button of the game scene. Run from the repository root with:
+python -m benchmarks.component_background
+"""
+import os
+import time
+
+# Render to memory so the benchmark runs without a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Rect, transform
+
+# The managers have to be imported before the components, as in main.py
+import managers.event_manager
+from managers.asset_manager import AssetManager
+from components.component import Component
+from components.style import Style
+
+IMAGE = "images/pause.jpg"
+REPEATS = 500
+
+
+def measure_scaling(screen: pygame.Surface, size: tuple) -> float:
+    """Return the microseconds taken to draw the image at <size> by loading
+    it without conversion and scaling it on every draw, as components did
+    before their backgrounds were cached.
+    """
+    raw_image = pygame.image.load(IMAGE)
+    rect = Rect((0, 0), size)
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        screen.blit(transform.scale(raw_image, size), rect)
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def measure_component(screen: pygame.Surface, size: tuple) -> float:
+    """Return the microseconds taken by a component of <size> to draw its
+    background image.
+    """
+    style = Style(background_image=AssetManager.instance.get_image(IMAGE))
+    component = Component(Rect((0, 0), size), style=style)
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        component._draw(screen, [])
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+if __name__ == '__main__':
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((1024, 768))
+    AssetManager()
+
+    print(f"{'size':>12}{'scaled us':>12}{'cached us':>12}")
+    for size in ((100, 100), (400, 400), (1024, 768)):
+        scaling = measure_scaling(screen, size)
+        cached = measure_component(screen, size)
+        print(f"{size[0]:>6}x{size[1]:<5}{scaling:>12.0f}{cached:>12.0f}")
@@ -0,0 +1,85 @@
+"""Measure the cost of finding the component under the mouse in a tree of
+buttons laid out as a board, such as a large game board. Run from the
+repository root with: python -m benchmarks.hit_test
+"""
+from random import Random
+import os
+import time
+
+# Render to memory so the benchmark runs without a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Rect
+
+# The managers have to be imported before the components, as in main.py
+import managers.event_manager
+from managers.asset_manager import AssetManager
+from components.component import Component
+from components.hit_index import HitIndex
+
+WIDTH = 1024
+HEIGHT = 768
+REPEATS = 2000
+
+
+def walk(pos, component):
+    """Find the component at <pos> by walking the tree of <component>, as
+    the EventManager did before it used a HitIndex.
+    """
+    children = component.get_children()
+    for i in range(len(children) - 1, -1, -1):
+        hit = walk(pos, children[i])
+        if(hit is not None):
+            return hit
+
+    if(component.get_rect().collidepoint(pos) and component.is_enabled()):
+        return component
+    return None
+
+
+def measure(columns: int):
+    """Return the microseconds taken by a tree walk and by a HitIndex to
+    find the component at a random position of a board of <columns> by
+    <columns> cells.
+    """
+    root = Component(Rect(0, 0, WIDTH, HEIGHT))
+    board = Component(Rect(0, 0, WIDTH, HEIGHT), parent=root)
+    cell_w = WIDTH // columns
+    cell_h = HEIGHT // columns
+    for y in range(columns):
+        for x in range(columns):
+            Component(Rect(x * cell_w, y * cell_h, cell_w, cell_h),
+                      parent=board)
+
+    index = HitIndex()
+    index.set_root(root)
+
+    rng = Random(columns)
+    positions = [(rng.randrange(WIDTH), rng.randrange(HEIGHT))
+                 for _ in range(REPEATS)]
+
+    start = time.perf_counter()
+    for pos in positions:
+        walk(pos, root)
+    walked = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pos in positions:
+        index.hit_test(pos)
+    indexed = time.perf_counter() - start
+
+    return walked / REPEATS * 1e6, indexed / REPEATS * 1e6
+
+
+if __name__ == '__main__':
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    AssetManager()
+    managers.event_manager.EventManager()
+
+    print(f"{'components':>12}{'walk us':>10}{'index us':>10}")
+    for columns in (10, 30, 100):
+        walked, indexed = measure(columns)
+        print(f"{columns * columns + 2:>12}{walked:>10.1f}{indexed:>10.2f}")
@@ -1,14 +1,15 @@
-from typing import List, Callable, Tuple
+from typing import Iterable, List, Callable, Optional, Set, Tuple
 import math
 import os
 
-from pygame import Rect, Surface, transform, mouse, BLEND_RGB_MULT, cursors
+from pygame import Rect, Surface, mouse, BLEND_RGB_MULT, cursors
 
 from util.constants import BUTTON_CURSOR
 from components.label import Label
 from components.style import Style
 from components.component import Component
 from components.animated_image import AnimatedImage
+from managers.asset_manager import AssetManager
 from players.ship import Ship
 
 
@@ -19,7 +20,7 @@ class AnimatedGrid(AnimatedImage):
         _hover_pos:
             The position of the tile that is currently being hovered over.
         _tiles:
-            The list of grid tile positions that indicate an image should be
+            The set of grid tile positions that indicate an image should be
             drawn at those positions.
         _on_click_callback:
             The function that is called when a tile is clicked.
@@ -29,13 +30,25 @@ class AnimatedGrid(AnimatedImage):
             The amount of tiles to be put vertically.
         _horizontal_tile_count:
             The amount of tiles to be put horizontally.
+        _is_atlas:
+            Whether or not the tiles are composited onto the screen when the
+            grid is drawn instead of being drawn into animation frames.
+        _background:
+            In atlas mode, the tint and outlines of the grid, or None if they
+            are invisible.
+        _are_tiles_visible:
+            Whether or not the tile images are drawn. The grid's tint and
+            outlines are drawn either way.
     """
     _hover_pos: Tuple[int, int]
-    _tiles: List[Tuple[int, int]]
+    _tiles: Set[Tuple[int, int]]
     _on_click_callback: Callable[[Tuple[int, int]], None]
     _horizontal_tile_count: int
     _vertical_tile_count: int
     _scaled_frames: List[Surface]
+    _is_atlas: bool
+    _background: Optional[Surface]
+    _are_tiles_visible: bool
 
     def __init__(self,
                  rect: Rect,
@@ -44,6 +57,7 @@ class AnimatedGrid(AnimatedImage):
                  horizontal_tile_count: int = 10,
                  vertical_tile_count: int = 10,
                  on_click: Callable[[Tuple[int, int]], None] = None,
+                 atlas: bool = False,
                  style: Style = None,
                  parent: Component = None) -> None:
         """Create a new AnimatedGrid. <rect> is the rectangle representing this
@@ -52,17 +66,23 @@ class AnimatedGrid(AnimatedImage):
         <animation_duration> is the length of the animation in miliseconds.
         <vertical_tile_count> is the number of tiles to be put vertically.
         <horizontal_tile_count> is the number of tiles to be put horizontally.
-        <on_click> is the function called when a tile is clicked. <style>
-        dictates the appearence of the component. If None, the default style
+        <on_click> is the function called when a tile is clicked. <atlas> is
+        whether the tiles are composited onto the screen from the scaled
+        frames when the grid is drawn, which keeps a single grid sized surface
+        no matter how many frames the animation has. <style> dictates the
+        appearence of the component. If None, the default style
         will be used. <parent> is the component that is immediately above this
         component in the tree.
         """
         self._hover_pos = (0, 0)
-        self._tiles = []
+        self._tiles = set()
         self._on_click_callback = on_click
         self._horizontal_tile_count = horizontal_tile_count
         self._vertical_tile_count = vertical_tile_count
         self._scaled_frames = []
+        self._is_atlas = atlas
+        self._background = None
+        self._are_tiles_visible = True
 
         AnimatedImage.__init__(self, rect,
                                folder_path=folder_path,
@@ -70,44 +90,101 @@ class AnimatedGrid(AnimatedImage):
                                style=style,
                                parent=parent)
 
-    def set_tiles(self, tiles: List[Tuple[int, int]]) -> None:
-        """Set the animated grid's tiles to <tiles>. This function will
-        update the animation frames.
+    def set_tiles(self, tiles: Iterable[Tuple[int, int]]) -> None:
+        """Set the animated grid's tiles to <tiles>. Only the tiles that were
+        added or removed are drawn to the animation frames.
         """
-        added = [tile for tile in tiles if tile not in self._tiles]
-        removed = [tile for tile in self._tiles if tile not in tiles]
+        tiles = {(int(tile[0]), int(tile[1])) for tile in tiles}
+        added = tiles - self._tiles
+        removed = self._tiles - tiles
 
         self._tiles = tiles
         self._draw_tiles(added)
         self._remove_tiles(removed)
         self._redraw()
 
-    def _remove_tiles(self, tiles):
+    def add_tile(self, tile: Tuple[int, int]) -> None:
+        """Add <tile> to the animated grid's tiles, drawing only that tile to
+        the animation frames. Does nothing if <tile> is already a tile.
+        """
+        tile = (int(tile[0]), int(tile[1]))
+        if(tile in self._tiles):
+            return
+
+        self._tiles.add(tile)
+        self._draw_tiles((tile,))
+        self._redraw()
+
+    def remove_tile(self, tile: Tuple[int, int]) -> None:
+        """Remove <tile> from the animated grid's tiles, clearing only that
+        tile from the animation frames. Does nothing if <tile> is not a tile.
+        """
+        tile = (int(tile[0]), int(tile[1]))
+        if(tile not in self._tiles):
+            return
+
+        self._tiles.remove(tile)
+        self._remove_tiles((tile,))
+        self._redraw()
+
+    def get_tiles(self) -> Set[Tuple[int, int]]:
+        """Get the set of the animated grid's tiles."""
+        return self._tiles
+
+    def set_tiles_visible(self, visible: bool) -> None:
+        """Show or hide the tile images while keeping the grid's tiles. In
+        atlas mode this only changes what is drawn, otherwise the tiles are
+        drawn to or cleared from the animation frames.
+        """
+        if(visible == self._are_tiles_visible):
+            return
+
+        if(not visible):
+            self._remove_tiles(self._tiles)
+
+        self._are_tiles_visible = visible
+        self._draw_tiles(self._tiles)
+        self._redraw()
+
+    def are_tiles_visible(self) -> bool:
+        """Get whether or not the tile images are drawn."""
+        return self._are_tiles_visible
+
+    def _remove_tiles(self, tiles: Iterable[Tuple[int, int]]) -> None:
         """Remove every tile in <tiles> from the animation frames."""
-        for i in range(len(self._animation_frames)):
-            for tile in tiles:
-                rect = Rect(self._square_w * tile[0], self._square_h *
-                            tile[1], self._square_w, self._square_h)
+        if(self._is_atlas):
+            return
+
+        rects = [Rect(self._square_w * tile[0], self._square_h * tile[1],
+                      self._square_w, self._square_h) for tile in tiles]
 
+        for frame in self._animation_frames:
+            for rect in rects:
                 # Draw background color
-                self._animation_frames[i].fill(self._style.primary_color, rect)
+                frame.fill(self._style.primary_color, rect)
 
                 # Draw outlines
                 if(self._style.border_width > 0 and
                    self._style.secondary_color is not None):
-                    self._draw_outline(self._animation_frames[i], rect,
+                    self._draw_outline(frame, rect,
                                        self._style.secondary_color,
                                        self._style.border_width)
 
-    def _draw_tiles(self, tiles):
-        """Dray every tile in <tiles> to the animation frames."""
-        for i in range(len(self._scaled_frames)):
+    def _draw_tiles(self, tiles: Iterable[Tuple[int, int]]) -> None:
+        """Dray every tile in <tiles> to the animation frames, unless the
+        tiles are hidden.
+        """
+        if(self._is_atlas or not self._are_tiles_visible):
+            return
+
+        positions = [(self._square_w * tile[0], self._square_h * tile[1])
+                     for tile in tiles]
 
-            # Draw tile images
-            for tile in tiles:
-                rect = Rect(self._square_w * tile[0], self._square_h *
-                            tile[1], self._square_w, self._square_h)
-                self._animation_frames[i].blit(self._scaled_frames[i], rect)
+        # Draw tile images
+        for i in range(len(self._scaled_frames)):
+            self._animation_frames[i].blits(
+                [(self._scaled_frames[i], position)
+                 for position in positions], False)
 
     def update(self, dt: float) -> None:
         """Update the hovered tile position. <dt> is the time since last
@@ -120,12 +197,27 @@ class AnimatedGrid(AnimatedImage):
             self._hover_pos = pos
             self._redraw()
 
+    def _get_frame_count(self) -> int:
+        """Get the number of frames of the animation. In atlas mode the grid
+        only animates while it has visible tiles.
+        """
+        if(self._is_atlas):
+            if(len(self._tiles) == 0 or not self._are_tiles_visible):
+                return 0
+            return len(self._scaled_frames)
+
+        return AnimatedImage._get_frame_count(self)
+
     def _generate_animation_frames(self) -> None:
         """Create the animated grid's animation frames."""
         self._animation_frames = []
         self._square_w = self._rect.w // self._horizontal_tile_count
         self._square_h = self._rect.h // self._vertical_tile_count
 
+        if(self._is_atlas):
+            self._generate_atlas()
+            return
+
         tint_surface = Surface(self._rect.size).convert_alpha()
         tint_surface.set_colorkey(None)
 
@@ -141,8 +233,8 @@ class AnimatedGrid(AnimatedImage):
         self._scaled_frames = []
         for i in range(len(self._raw_frames)):
             animation_frame = tint_surface.copy()
-            self._scaled_frames.append(transform.smoothscale(
-                self._raw_frames[i], (self._square_w, self._square_h)))
+            self._scaled_frames.append(AssetManager.instance.get_scaled(
+                self._raw_frames[i], (self._square_w, self._square_h), True))
 
             # Draw outlines
             if(self._style.border_width > 0 and
@@ -158,11 +250,71 @@ class AnimatedGrid(AnimatedImage):
 
             self._animation_frames.append(animation_frame)
 
+        self._draw_tiles(self._tiles)
+
+    def _generate_atlas(self) -> None:
+        """Scale the raw frames to the size of a tile and draw the grid's
+        tint and outlines once.
+        """
+        self._scaled_frames = [
+            AssetManager.instance.get_scaled(
+                frame, (self._square_w, self._square_h), True)
+            for frame in self._raw_frames]
+
+        has_outline = self._style.border_width > 0 and \
+            self._style.secondary_color is not None
+        color = self._style.primary_color
+        self._background = None
+        if(not has_outline and
+           (color is None or (len(color) == 4 and color[3] == 0))):
+            return
+
+        self._background = Surface(self._rect.size).convert_alpha()
+        self._background.set_colorkey(None)
+        if(color is not None):
+            self._background.fill(color)
+
+        if(has_outline):
+            for y in range(self._vertical_tile_count):
+                for x in range(self._horizontal_tile_count):
+                    rect = Rect(self._square_w * x, self._square_h * y,
+                                self._square_w, self._square_h)
+                    self._draw_outline(self._background, rect,
+                                       self._style.secondary_color,
+                                       self._style.border_width)
+
+    def _draw_atlas(self, screen: Surface, changes: List[Rect]) -> None:
+        """Draw the grid's background, then the current frame onto every
+        tile. <changes> is a list of rectangles that represent the changed
+        areas of the screen.
+        """
+        Component._draw(self, screen, changes)
+
+        # Tiles scaled for an older size are kept inside the grid
+        clip = screen.get_clip()
+        screen.set_clip(self._rect.clip(clip))
+
+        if(self._background is not None):
+            screen.blit(self._background, self._rect)
+
+        if(self._get_frame_count() > 0):
+            frame = self._scaled_frames[self._frame_index %
+                                        len(self._scaled_frames)]
+            screen.blits([(frame, (self._rect.x + self._square_w * x,
+                                   self._rect.y + self._square_h * y))
+                          for x, y in self._tiles], False)
+
+        screen.set_clip(clip)
+        changes.append(self._rect.clip(screen.get_rect()))
+
     def _draw(self, screen: Surface, changes: List[Rect]) -> None:
         """Draw the animated grid's visuals to the screen. <change> is a list
         of rectangles that represent the changed areas of the screen.
         """
-        AnimatedImage._draw(self, screen, changes)
+        if(self._is_atlas):
+            self._draw_atlas(screen, changes)
+        else:
+            AnimatedImage._draw(self, screen, changes)
 
         if(self.is_hovered()):
             rect = Rect(self._square_w * self._hover_pos[0] + self._rect.x,
@@ -201,7 +353,7 @@ class AnimatedGrid(AnimatedImage):
             surface.fill(border_color, left_rect)
             surface.fill(border_color, right_rect)
 
-    def _mouse_pos_to_square_offset(self) -> int:
+    def _mouse_pos_to_square_offset(self) -> Tuple[int, int]:
         """Translate the mouse's position into an index into the animated
         grids's tiles.
         """
@@ -209,8 +361,8 @@ class AnimatedGrid(AnimatedImage):
         x -= self._rect.x
         y -= self._rect.y
 
-        return (x // (self._rect.w / self._horizontal_tile_count),
-                y // (self._rect.h / self._vertical_tile_count))
+        return (int(x // (self._rect.w / self._horizontal_tile_count)),
+                int(y // (self._rect.h / self._vertical_tile_count)))
 
     def _on_hover_enter(self) -> None:
         """Change the mouse cursor when the mouse moves over the animated grid.
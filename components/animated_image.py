@@ -1,14 +1,18 @@
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
-from pygame import Rect, Surface, image
+from pygame import Rect, Surface
 
 from components.component import Component
 from components.style import Style
-import os
+from managers.asset_manager import AssetManager
+import managers.scene_manager as sm
 
 
 class AnimatedImage(Component):
-    """A GUI element that displays an animated image.
+    """A GUI element that displays an animated image. The animation's frames
+    are generated again when the image is resized, but not while the user is
+    resizing the window, so dragging the window's edge stays smooth. The old
+    frames are shown until the window size settles.
 
     === Private Attributes ===
         _animation_duration:
@@ -19,15 +23,20 @@ class AnimatedImage(Component):
         _animation_frames:
             The list of loaded animation frames.
         _raw_frames:
-            The list of loaded images.
+            The loaded images, shared with every component showing the same
+            animation.
         _frame_index:
             The index of the current animation frame in _animation_frames.
+        _frames_size:
+            The size the animation frames were generated for, or None if
+            they were never generated.
     """
     _animation_duration: float
     _time_since_last_frame: float
     _animation_frames: List[Surface]
-    _raw_frames: List[Surface]
+    _raw_frames: Sequence[Surface]
     _frame_index: int
+    _frames_size: Optional[Tuple[int, int]]
 
     def __init__(self,
                  rect: Rect,
@@ -48,6 +57,7 @@ class AnimatedImage(Component):
 
         self._frame_index = 0
         self._time_since_last_frame = 0
+        self._frames_size = None
 
         self._animation_duration = animation_duration
         self._load_animation(folder_path)
@@ -56,36 +66,52 @@ class AnimatedImage(Component):
 
     def set_rect(self, rect: Rect):
         """Set the animated image's rectangle and generate the animation's
-        frames.
+        frames if its size changed, unless the window is being resized.
         """
         Component.set_rect(self, rect)
-        self._generate_animation_frames()
+
+        if(self._frames_size is None or not _is_window_resizing()):
+            self._update_animation_frames()
 
     def update(self, dt: float):
-        """Update the frame index. <dt> is the time since last update in
-        milliseconds.
+        """Update the frame index, and generate the animation's frames once
+        the window size settles after a resize. <dt> is the time since last
+        update in milliseconds.
         """
         Component.update(self, dt)
 
-        if(len(self._animation_frames) == 0):
+        if(self._frames_size != self._rect.size and
+           not _is_window_resizing()):
+            self._update_animation_frames()
+
+        frame_count = self._get_frame_count()
+        if(frame_count == 0):
             return
 
         self._time_since_last_frame += dt
         if(self._time_since_last_frame > self._time_per_frame):
             self._time_since_last_frame -= self._time_per_frame
-            self._frame_index = (self._frame_index +
-                                 1) % len(self._animation_frames)
+            self._frame_index = (self._frame_index + 1) % frame_count
             self._redraw()
 
-    def _load_animation(self, folder_path: str) -> None:
-        """Load the raw frames of the animation from <folder_path>. The images
-        are sorted by filename in ascending order.
+    def _update_animation_frames(self) -> None:
+        """Generate the animation's frames if they were generated for another
+        size.
         """
-        self._raw_frames.clear()
+        if(self._frames_size != self._rect.size):
+            self._frames_size = self._rect.size
+            self._generate_animation_frames()
+            self._redraw()
 
-        for filepath in sorted(os.listdir(folder_path)):
-            self._raw_frames.append(image.load(
-                f"{folder_path}/{filepath}").convert_alpha())
+    def _get_frame_count(self) -> int:
+        """Get the number of frames of the animation."""
+        return len(self._animation_frames)
+
+    def _load_animation(self, folder_path: str) -> None:
+        """Get the raw frames of the animation in <folder_path> from the
+        AssetManager. The images are sorted by filename in ascending order.
+        """
+        self._raw_frames = AssetManager.instance.get_animation(folder_path)
 
         self._time_per_frame = self._animation_duration / \
             len(self._raw_frames)
@@ -99,9 +125,16 @@ class AnimatedImage(Component):
         if(len(self._animation_frames) == 0):
             return
 
+        # Frames generated for an older size are cropped to the image
         changes.append(screen.blit(self._animation_frames[self._frame_index],
-                                   self._rect))
+                                   self._rect, Rect((0, 0), self._rect.size)))
 
     def _generate_animation_frames(self) -> None:
         """Create the animation's frames. Modify a copy of the raw frames."""
         self._animation_frames = self._raw_frames
+
+
+def _is_window_resizing() -> bool:
+    """Return whether the user is currently resizing the window."""
+    return sm.SceneManager.instance is not None and \
+        sm.SceneManager.instance.is_resizing()
@@ -1,12 +1,30 @@
-from pygame import Rect, Surface, transform, BLEND_RGB_MULT, BLEND_RGB_ADD
+from typing import List
+
+from pygame import Rect, Surface, BLEND_RGB_MULT, BLEND_RGB_ADD
 
 from components.style import Style
 from components.component import Component
 from components.animated_image import AnimatedImage
+from managers.asset_manager import AssetManager
 
 
 class BackgroundWater(AnimatedImage):
-    """A GUI element that displays an animated background water."""
+    """A GUI element that displays an animated background water. Only the
+    frames of a single tile are kept, and they are tiled over the visible
+    part of the water when it is drawn. The scaled tiles come from the
+    AssetManager, so changing scenes does not scale them again.
+
+    === Private Attributes ===
+        _horizontal_tile_count:
+            The amount of tiles to be put horizontally.
+        _vertical_tile_count:
+            The amount of tiles to be put vertically.
+        _scaled_tiles:
+            The animation frames scaled to the size of one tile.
+    """
+    _horizontal_tile_count: int
+    _vertical_tile_count: int
+    _scaled_tiles: List[Surface]
 
     def __init__(self,
                  rect: Rect,
@@ -20,6 +38,7 @@ class BackgroundWater(AnimatedImage):
         """
         self._horizontal_tile_count = 10
         self._vertical_tile_count = 10
+        self._scaled_tiles = []
 
         AnimatedImage.__init__(self, rect,
                                folder_path="images/water",
@@ -28,20 +47,47 @@ class BackgroundWater(AnimatedImage):
                                parent=parent)
 
     def _generate_animation_frames(self) -> None:
-        """Create the water's tiles animation frames."""
-        square_w = self._rect.w // self._horizontal_tile_count
-        square_h = self._rect.h // self._vertical_tile_count
+        """Scale the water's frames to the size of a tile."""
+        tile_size = (max(self._rect.w // self._horizontal_tile_count, 1),
+                     max(self._rect.h // self._vertical_tile_count, 1))
+
+        self._scaled_tiles = []
+        for raw_frame in self._raw_frames:
+            tile = AssetManager.instance.get_scaled(raw_frame, tile_size, True)
+
+            # The water is opaque, which makes the tiles faster to draw
+            tile = tile.convert()
+            tile.set_colorkey(None)
+            self._scaled_tiles.append(tile)
+
+    def _get_frame_count(self) -> int:
+        """Get the number of frames of the animation."""
+        return len(self._scaled_tiles)
+
+    def _draw(self, screen: Surface, changes: List[Rect]) -> None:
+        """Tile the current frame over the part of the water that is inside
+        the screen's clipping area. <changes> is a list of rectangles that
+        represent the changed areas of the screen.
+        """
+        Component._draw(self, screen, changes)
 
-        self._animation_frames = []
-        for i in range(len(self._raw_frames)):
+        clip = screen.get_clip()
+        area = self._rect.clip(clip)
+        if(len(self._scaled_tiles) == 0 or area.w == 0 or area.h == 0):
+            return
 
-            animation_frame = Surface(self._rect.size).convert()
-            frame = transform.smoothscale(
-                self._raw_frames[i], (square_w, square_h))
-            frame.set_colorkey(None)
+        tile = self._scaled_tiles[self._frame_index]
+        tile_w, tile_h = tile.get_size()
+        first_x = (area.x - self._rect.x) // tile_w
+        last_x = (area.right - self._rect.x - 1) // tile_w
+        first_y = (area.y - self._rect.y) // tile_h
+        last_y = (area.bottom - self._rect.y - 1) // tile_h
 
-            for y in range(self._vertical_tile_count):
-                for x in range(self._horizontal_tile_count):
-                    animation_frame.blit(frame, (square_w * x, square_h * y))
+        screen.set_clip(area)
+        screen.blits([(tile, (self._rect.x + tile_w * x,
+                              self._rect.y + tile_h * y))
+                      for y in range(first_y, last_y + 1)
+                      for x in range(first_x, last_x + 1)], False)
+        screen.set_clip(clip)
 
-            self._animation_frames.append(animation_frame)
+        changes.append(area)
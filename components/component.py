@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
-from pygame import Rect, Surface, transform
+from pygame import Rect, Surface
 
 from components.style import Style
 import managers.event_manager as em
+from managers.asset_manager import AssetManager
+
+if TYPE_CHECKING:
+    from components.hit_index import HitIndex
 
 
 class Component(object):
@@ -25,6 +29,14 @@ class Component(object):
             A Style object that dictates the appearance of the component
         _parent:
             The component immediately above this component in the tree
+        _background:
+            The style's background image scaled to the component's size, or
+            None if it has not been scaled yet
+        _background_source:
+            The background image that _background was scaled from
+        _hit_index:
+            The HitIndex of the tree this component is in, or None if the
+            tree is not indexed
     """
     _rect: Rect
     _needs_redraw: bool
@@ -32,6 +44,9 @@ class Component(object):
     _children: List[Component]
     _style: Style
     _parent: Component
+    _background: Optional[Surface]
+    _background_source: Optional[Surface]
+    _hit_index: Optional[HitIndex]
 
     def __init__(self,
                  rect: Rect,
@@ -48,6 +63,9 @@ class Component(object):
         self._children = []
         self._parent = None
         self._rect = None
+        self._background = None
+        self._background_source = None
+        self._hit_index = None
         self.set_style(style)
         self.set_rect(rect)
         self.set_parent(parent)
@@ -62,6 +80,8 @@ class Component(object):
                     changed_x, changed_y))
 
         self._rect = rect
+        if(self._hit_index is not None):
+            self._hit_index.move(self)
         self._redraw()
 
     def set_style(self, style: Optional[Style]) -> None:
@@ -95,6 +115,8 @@ class Component(object):
 
             child._parent = self
             self._children.append(child)
+            if(self._hit_index is not None):
+                self._hit_index.add_tree(child)
             self._redraw()
             em.EventManager.instance.set_invalid()
 
@@ -105,6 +127,8 @@ class Component(object):
         for i in range(len(self._children)-1, -1, -1):
             if(self._children[i] == child):
                 self._children.pop(i)._parent = None
+                if(child._hit_index is not None):
+                    child._hit_index.remove_tree(child)
                 self._redraw()
                 em.EventManager.instance.set_invalid()
                 return
@@ -112,7 +136,10 @@ class Component(object):
     def clear_children(self) -> None:
         """Remove all child components."""
         for i in range(len(self._children)-1, -1, -1):
-            self._children.pop(i)._parent = None
+            child = self._children.pop(i)
+            child._parent = None
+            if(child._hit_index is not None):
+                child._hit_index.remove_tree(child)
         self._redraw()
         em.EventManager.instance.set_invalid()
 
@@ -193,6 +220,19 @@ class Component(object):
             else:
                 self._redraw_children()
 
+    def _get_background(self) -> Surface:
+        """Get the style's background image scaled to the component's size.
+        The image is only scaled again when the size or the image changes.
+        """
+        if(self._background is None or
+           self._background_source is not self._style.background_image or
+           self._background.get_size() != self._rect.size):
+            self._background_source = self._style.background_image
+            self._background = AssetManager.instance.get_scaled(
+                self._background_source, self._rect.size)
+
+        return self._background
+
     def _draw(self, screen: Surface, changes: List[Rect]) -> None:
         """Draw the component's visuals to the <screen>. <change> is a list of
         rectangles that represent the changed areas of the screen.
@@ -205,9 +245,7 @@ class Component(object):
 
         # Draw Background Image
         if(self._style.background_image is not None):
-            changes.append(screen.blit(transform.scale(
-                self._style.background_image, (self._rect.w, self._rect.h)),
-                self._rect))
+            changes.append(screen.blit(self._get_background(), self._rect))
 
         # Draw Border
         if(self._style.border_color is not None and
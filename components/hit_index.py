@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from components.component import Component
+
+# The width and height in pixels of a cell of the index
+CELL_SIZE = 64
+
+
+class HitIndex(object):
+    """A uniform grid over the rectangles of every component in a tree, used
+    to find the component under the mouse without walking the whole tree.
+    Components keep the index up to date when their rectangle changes or
+    when children are added or removed.
+
+    The component found at a position is the one that the mouse is over and
+    that is drawn last, with the same rules as a walk of the tree: children
+    are above their parent, and later children are above earlier ones.
+
+    === Private Attributes ===
+        _root:
+            The root of the indexed tree, or None if nothing is indexed.
+        _cells:
+            Maps the column and row of every cell to the components whose
+            rectangle overlaps it.
+        _spans:
+            Maps every indexed component to the first and last column and
+            row of the cells it is in.
+        _order:
+            Maps every indexed component to its position in the order the
+            tree is drawn.
+        _is_order_valid:
+            Whether _order matches the tree.
+    """
+    _root: Optional[Component]
+    _cells: Dict[Tuple[int, int], List[Component]]
+    _spans: Dict[Component, Tuple[int, int, int, int]]
+    _order: Dict[Component, int]
+    _is_order_valid: bool
+
+    def __init__(self) -> None:
+        """Create a new empty HitIndex."""
+        self._root = None
+        self._cells = {}
+        self._spans = {}
+        self._order = {}
+        self._is_order_valid = True
+
+    def get_root(self) -> Optional[Component]:
+        """Get the root of the indexed tree."""
+        return self._root
+
+    def set_root(self, root: Optional[Component]) -> None:
+        """Index the tree of <root> instead of the current tree."""
+        if(self._root is not None):
+            self.remove_tree(self._root)
+
+        self._root = root
+        if(root is not None):
+            self.add_tree(root)
+
+    def add_tree(self, component: Component) -> None:
+        """Index <component> and every component below it."""
+        stack = [component]
+        while(len(stack) > 0):
+            current = stack.pop()
+            current._hit_index = self
+            self._spans[current] = (0, -1, 0, -1)
+            self.move(current)
+            stack.extend(current.get_children())
+
+        self._is_order_valid = False
+
+    def remove_tree(self, component: Component) -> None:
+        """Stop indexing <component> and every component below it."""
+        stack = [component]
+        while(len(stack) > 0):
+            current = stack.pop()
+            if(current._hit_index is not self):
+                continue
+
+            self._place(current, (0, -1, 0, -1))
+            del self._spans[current]
+            current._hit_index = None
+            stack.extend(current.get_children())
+
+        if(component is self._root):
+            self._root = None
+        self._is_order_valid = False
+
+    def move(self, component: Component) -> None:
+        """Update the cells of <component> after its rectangle changed."""
+        rect = component._rect
+        if(rect.w <= 0 or rect.h <= 0):
+            span = (0, -1, 0, -1)
+        else:
+            span = (rect.x // CELL_SIZE, (rect.right - 1) // CELL_SIZE,
+                    rect.y // CELL_SIZE, (rect.bottom - 1) // CELL_SIZE)
+
+        if(span != self._spans[component]):
+            self._place(component, span)
+
+    def hit_test(self, pos: Tuple[int, int]) -> Optional[Component]:
+        """Get the enabled component drawn last at position <pos>, or None if
+        there is no component there.
+        """
+        candidates = self._cells.get((int(pos[0]) // CELL_SIZE,
+                                      int(pos[1]) // CELL_SIZE))
+        if(candidates is None):
+            return None
+
+        if(not self._is_order_valid):
+            self._number()
+
+        hit = None
+        hit_order = -1
+        for component in candidates:
+            order = self._order[component]
+            if(order > hit_order and component._rect.collidepoint(pos) and
+               component.is_enabled()):
+                hit = component
+                hit_order = order
+
+        return hit
+
+    def _place(self,
+               component: Component,
+               span: Tuple[int, int, int, int]) -> None:
+        """Move <component> from the cells of its current span to the cells
+        of <span>.
+        """
+        left, right, top, bottom = self._spans[component]
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                cell = self._cells[(column, row)]
+                cell.remove(component)
+                if(len(cell) == 0):
+                    del self._cells[(column, row)]
+
+        left, right, top, bottom = span
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                self._cells.setdefault((column, row), []).append(component)
+
+        self._spans[component] = span
+
+    def _number(self) -> None:
+        """Number the indexed components in the order they are drawn."""
+        self._order.clear()
+        stack = [self._root] if self._root is not None else []
+        while(len(stack) > 0):
+            component = stack.pop()
+            self._order[component] = len(self._order)
+            stack.extend(reversed(component.get_children()))
+
+        self._is_order_valid = True
@@ -1,22 +1,25 @@
-from typing import List
+from typing import List, Optional
 
 from pygame import Rect, Surface
 
 from components.component import Component
 from components.style import Style
+from managers.asset_manager import AssetManager
 
 
 class Label(Component):
-    """A GUI element that displays text.
+    """A GUI element that displays text. Rendered text is shared through the
+    AssetManager, so setting a text that was shown before is cheap.
 
     === Private Attributes ===
         _text:
             The text to be displayed.
         _text_image:
-            The surface of the rendered text.
+            The surface of the rendered text, or None before the text is
+            first set.
     """
     _text: str
-    _text_image: Surface
+    _text_image: Optional[Surface]
 
     def __init__(self,
                  rect: Rect,
@@ -29,6 +32,8 @@ class Label(Component):
         the default style will be used. <parent> is the component that is
         immediately above this component in the tree.
         """
+        self._text_image = None
+
         Component.__init__(self, rect, style=style, parent=parent)
         self.set_text(text)
 
@@ -37,11 +42,16 @@ class Label(Component):
         return self._text
 
     def set_text(self, text: str) -> None:
-        """Set the displayed text."""
+        """Set the displayed text. The label is only redrawn if the text looks
+        different.
+        """
+        text_image = AssetManager.instance.render_text(
+            self._style.font, text, True, self._style.primary_color)
+
         self._text = text
-        self._text_image = self._style.font.render(
-            text, True, self._style.primary_color)
-        self._redraw()
+        if(text_image is not self._text_image):
+            self._text_image = text_image
+            self._redraw()
 
     def _draw(self, screen: Surface, changes: List[Rect]) -> None:
         """Draw the label's background and text to the <screen>. <change> is a
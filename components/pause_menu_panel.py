@@ -1,6 +1,5 @@
-from typing import Optional
+from typing import Optional, Tuple
 
-import pygame
 from pygame import Rect, Surface
 
 from components.component import Component
@@ -12,6 +11,7 @@ from components.slider import Slider
 from components.textbox import Textbox
 from components.vertical_panel import VerticalPanel
 import managers.scene_manager as sm
+from managers.asset_manager import AssetManager
 
 
 class PauseMenuPanel(Panel):
@@ -25,25 +25,20 @@ class PauseMenuPanel(Panel):
         if(self._parent is None):
             return
 
+        self.clear_children()
         self.set_rect(self._parent.get_rect())
         size = self.get_rect().size
 
-        title_rect = Rect(0, 0, 500, 70)
-        title_rect.center = (size[0] / 2, size[1] / 2 - 200)
-
-        self.clear_children()
-
-        self.options_panel = VerticalPanel(rect=Rect(size[0] / 4, size[1] / 2,
-                                                     size[0] / 2, size[1] / 4),
+        self.options_panel = VerticalPanel(rect=self._get_options_rect(size),
                                            expand_height=False,
                                            parent=self)
 
+        title_font = AssetManager.instance.get_font('freesansbold.ttf', 64)
         self.title_label = Label(text="BATTLE SHIP!",
-                                 rect=title_rect,
+                                 rect=self._get_title_rect(size),
                                  style=Style(background_color=None,
                                              border_width=0,
-                                             font=pygame.font.Font(
-                                                 'freesansbold.ttf', 64),
+                                             font=title_font,
                                              primary_color=(255, 255, 255)),
                                  parent=self)
 
@@ -51,7 +46,8 @@ class PauseMenuPanel(Panel):
                              background_color=(128, 0, 0),
                              border_width=1,
                              border_color=(0, 0, 0),
-                             font=pygame.font.Font('freesansbold.ttf', 32))
+                             font=AssetManager.instance.get_font(
+                                 'freesansbold.ttf', 32))
 
         self.cont_button = Button(rect=Rect(0, 0, 400, 40),
                                   on_click=self._cont_clicked,
@@ -71,6 +67,26 @@ class PauseMenuPanel(Panel):
                                   style=button_style,
                                   parent=self.options_panel)
 
+    def set_rect(self, rect: Rect) -> None:
+        """Set the pause menu's rectangle and center the title and the
+        options on it.
+        """
+        Panel.set_rect(self, rect)
+
+        if(len(self._children) > 0):
+            self.title_label.set_rect(self._get_title_rect(rect.size))
+            self.options_panel.set_rect(self._get_options_rect(rect.size))
+
+    def _get_title_rect(self, size: Tuple[int, int]) -> Rect:
+        """Get the rectangle of the title on a menu of <size>."""
+        title_rect = Rect(0, 0, 500, 70)
+        title_rect.center = (size[0] / 2, size[1] / 2 - 200)
+        return title_rect
+
+    def _get_options_rect(self, size: Tuple[int, int]) -> Rect:
+        """Get the rectangle of the options on a menu of <size>."""
+        return Rect(size[0] / 4, size[1] / 2, size[0] / 2, size[1] / 4)
+
     def _cont_clicked(self, button: int):
         self.set_parent(None)
 
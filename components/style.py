@@ -2,6 +2,8 @@ from typing import Tuple
 
 import pygame
 
+from managers.asset_manager import AssetManager
+
 
 class Style(object):
     """A GUI element that displays text.
@@ -60,7 +62,8 @@ class Style(object):
         foregrounds. <secondary_color> is the second general purpose color
         for component foregrounds. <force_parent_redraw> is whether or not to
         force the parent component to redraw when the component is redrawn.
-        <font> is the text style to be used for any displayed text.
+        <font> is the text style to be used for any displayed text. If None,
+        the shared default font at size 30 is used.
         <border_width> is the size of a solid border in pixels around a
         component. A value of 0 indicates no border. <border_color> is the
         color for component borders. A value of None indicates no border color.
@@ -78,6 +81,6 @@ class Style(object):
         self.tertiary_color = tertiary_color
 
         if(font is None):
-            self.font = pygame.font.Font(None, 30)
+            self.font = AssetManager.instance.get_font(None, 30)
         else:
             self.font = font
@@ -0,0 +1,178 @@
+from random import Random
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from players.board import Board
+from engine.placements import get_placement_index
+
+
+class BatchGame(object):
+    """Many independent games of Battleships stepped together. Every game is
+    a row of stacked NumPy arrays, so a single step resolves one shot in each
+    game with a handful of vectorised operations instead of a Python call per
+    game. The rules and result codes match Game.guess and GameManager.guess.
+
+    === Private Attributes ===
+        _size:
+            The width and height of every board.
+        _ship_at:
+            An array of shape (games, 2, size * size) holding, for each board,
+            the number of the ship at every cell, or -1 for open water.
+        _shot:
+            An array of shape (games, 2, size * size) that is True for every
+            cell of each board that has already been shot.
+        _cells_left:
+            An array of shape (games, 2, ships) holding the number of cells of
+            each ship that have not been hit yet.
+        _ships_left:
+            An array of shape (games, 2) holding the number of ships on each
+            board that are not sunk.
+        _turn:
+            An array of shape (games,) holding the index of the player who
+            has to make the next shot in each game.
+        _winner:
+            An array of shape (games,) holding the index of the winning player
+            of each game, or -1 if it is not over.
+    """
+    _size: int
+    _ship_at: np.ndarray
+    _shot: np.ndarray
+    _cells_left: np.ndarray
+    _ships_left: np.ndarray
+    _turn: np.ndarray
+    _winner: np.ndarray
+
+    def __init__(self, ship_at: np.ndarray) -> None:
+        """Create a batch of games from <ship_at>, an integer array of shape
+        (games, 2, size, size) holding the number of the ship at every cell
+        of both boards, or -1 for open water. Ships are numbered from 0 on
+        each board. Player 1 shoots first in every game.
+        """
+        ship_at = np.asarray(ship_at)
+        games, players, size, _ = ship_at.shape
+        self._size = size
+        self._ship_at = ship_at.reshape(games, players, size * size) \
+            .astype(np.int16)
+        self._shot = np.zeros(self._ship_at.shape, dtype=bool)
+
+        ship_count = max(int(self._ship_at.max()) + 1, 1)
+        self._cells_left = np.zeros((games, players, ship_count),
+                                    dtype=np.int16)
+        board, cell = np.nonzero(self._ship_at.reshape(-1, size * size) >= 0)
+        np.add.at(self._cells_left.reshape(-1, ship_count),
+                  (board, self._ship_at.reshape(-1, size * size)[board, cell]),
+                  1)
+
+        self._ships_left = (self._cells_left > 0).sum(axis=2) \
+            .astype(np.int16)
+        self._turn = np.zeros(games, dtype=np.int8)
+        self._winner = np.full(games, -1, dtype=np.int8)
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[Tuple[Board, Board]]) \
+            -> 'BatchGame':
+        """Create a batch of games with the same fleets as the pairs of
+        scalar <boards>. Shots already taken at the boards are ignored.
+        """
+        size = boards[0][0].get_size()
+        ship_at = np.full((len(boards), 2, size, size), -1, dtype=np.int16)
+        for game, pair in enumerate(boards):
+            for player, board in enumerate(pair):
+                for number, ship in enumerate(board.get_ships()):
+                    for x, y in ship.get_coordinates():
+                        ship_at[game, player, y, x] = number
+
+        return cls(ship_at)
+
+    @classmethod
+    def random(cls,
+               games: int,
+               size: int,
+               ship_lengths: Tuple[int, ...],
+               rng: Random) -> 'BatchGame':
+        """Create a batch of <games> games where both fleets of every game
+        are placed at random by <rng>.
+        """
+        index = get_placement_index(size, tuple(ship_lengths))
+        return cls.from_boards([(index.random_fleet(rng),
+                                 index.random_fleet(rng))
+                                for _ in range(games)])
+
+    def step(self, xs: Sequence[int], ys: Sequence[int]) -> np.ndarray:
+        """Take one shot in every game, for the player whose turn it is, at
+        the coordinates (<xs>[i], <ys>[i]). Returns an int8 array holding 0
+        for a miss, 1 for a hit, 2 for a sink and -1 for an invalid move in
+        each game. Invalid moves, including any shot in a finished game, do
+        not change the game or pass the turn.
+        """
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        results = np.full(len(self._turn), -1, dtype=np.int8)
+
+        games = np.nonzero((self._winner == -1) &
+                           (0 <= xs) & (xs < self._size) &
+                           (0 <= ys) & (ys < self._size))[0]
+        opponents = 1 - self._turn[games]
+        cells = ys[games].astype(np.intp) * self._size + xs[games]
+
+        # Repeated shots are invalid
+        fresh = ~self._shot[games, opponents, cells]
+        games = games[fresh]
+        opponents = opponents[fresh]
+        cells = cells[fresh]
+        self._shot[games, opponents, cells] = True
+
+        # Hits, sinks and wins
+        ships = self._ship_at[games, opponents, cells]
+        hit = ships >= 0
+        hit_games = games[hit]
+        hit_boards = opponents[hit]
+        self._cells_left[hit_games, hit_boards, ships[hit]] -= 1
+        sunk = self._cells_left[hit_games, hit_boards, ships[hit]] == 0
+
+        sunk_games = hit_games[sunk]
+        sunk_boards = hit_boards[sunk]
+        self._ships_left[sunk_games, sunk_boards] -= 1
+        won = self._ships_left[sunk_games, sunk_boards] == 0
+        self._winner[sunk_games[won]] = 1 - sunk_boards[won]
+
+        outcome = np.zeros(len(games), dtype=np.int8)
+        outcome[hit] = 1 + sunk
+        results[games] = outcome
+        self._turn[games] = opponents
+        return results
+
+    def get_size(self) -> int:
+        """Get the width and height of every board."""
+        return self._size
+
+    def get_game_count(self) -> int:
+        """Get the number of games in the batch."""
+        return len(self._turn)
+
+    def get_turns(self) -> np.ndarray:
+        """Get the index of the player who shoots next in every game."""
+        return self._turn
+
+    def get_winners(self) -> np.ndarray:
+        """Get the index of the winner of every game, or -1 if it is not
+        over.
+        """
+        return self._winner
+
+    def is_over(self) -> np.ndarray:
+        """Get whether or not each game is over."""
+        return self._winner != -1
+
+    def get_shot_masks(self) -> np.ndarray:
+        """Get a bool array of shape (games, 2, size, size) that is True for
+        every cell of each board that has been shot.
+        """
+        return self._shot.reshape(-1, 2, self._size, self._size)
+
+    def get_ships_left(self) -> np.ndarray:
+        """Get the number of ships not sunk on each board, with shape
+        (games, 2).
+        """
+        return self._ships_left
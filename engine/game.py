@@ -0,0 +1,141 @@
+from random import Random
+from typing import List, Optional, Tuple
+
+from players.board import Board
+from engine.placements import SPARSE_BOARD_SIZE, get_placement_index, \
+    random_sparse_fleet
+from engine.strategy import Strategy
+
+# The lengths of the ships in a standard fleet
+DEFAULT_SHIP_LENGTHS = (5, 4, 3, 3, 2)
+
+
+class Game(object):
+    """A game of Battleships between two boards. Unlike the GameManager, a
+    Game has no dependency on pygame, the manager singletons or the console,
+    so any number of them can be played in the same process.
+
+    === Private Attributes ===
+        _boards:
+            The boards of player 1 and player 2, in that order.
+        _turn:
+            The index of the player who has to make the next shot.
+        _shots:
+            The number of accepted shots each player has made.
+        _winner:
+            The index of the player who won, or None if the game is not over.
+    """
+
+    _boards: Tuple[Board, Board]
+    _turn: int
+    _shots: List[int]
+    _winner: Optional[int]
+
+    def __init__(self, board1: Board, board2: Board, turn: int = 0) -> None:
+        """Create a new game where player 1 owns <board1> and player 2 owns
+        <board2>. <turn> is the index of the player who shoots first. Shots
+        already taken at the boards count towards the game, so a game can be
+        resumed from its boards.
+        """
+        self._boards = (board1, board2)
+        self._turn = turn
+        self._shots = [board2.get_shot_count(), board1.get_shot_count()]
+        self._winner = None
+
+        if(board2.is_defeated()):
+            self._winner = 0
+        elif(board1.is_defeated()):
+            self._winner = 1
+
+    def guess(self, player: int, coordinate: Tuple[int, int]) -> int:
+        """Make a guess for player index <player> at <coordinate>. Returns 0
+        if the guess misses, 1 if it hits, 2 if it sinks a ship, and -1 if it
+        is an invalid move.
+        """
+        if(self._winner is not None or player != self._turn):
+            return -1
+
+        opponent = 1 - player
+        result = self._boards[opponent].shoot(coordinate)
+        if(result == -1):
+            return -1
+
+        self._shots[player] += 1
+        if(result == 2 and self._boards[opponent].is_defeated()):
+            self._winner = player
+
+        self._turn = opponent
+        return result
+
+    def get_whos_turn(self) -> int:
+        """Get the index of the player who has to make the next shot."""
+        return self._turn
+
+    def get_board(self, player: int) -> Board:
+        """Get the board owned by player index <player>."""
+        return self._boards[player]
+
+    def get_size(self) -> int:
+        """Get the width and height of the boards."""
+        return self._boards[0].get_size()
+
+    def get_shots(self, player: int) -> int:
+        """Get the number of accepted shots player index <player> made."""
+        return self._shots[player]
+
+    def get_winner(self) -> Optional[int]:
+        """Get the index of the winning player, or None if the game is not
+        over.
+        """
+        return self._winner
+
+    def is_over(self) -> bool:
+        """Return whether one of the players has sunk every enemy ship."""
+        return self._winner is not None
+
+
+def random_fleet(size: int,
+                 ship_lengths: List[int],
+                 rng: Random) -> Board:
+    """Create a <size> by <size> board holding a ship of each length in
+    <ship_lengths>, placed horizontally or vertically at random positions
+    chosen by <rng> so that no ships overlap. Boards wider than
+    SPARSE_BOARD_SIZE are sparse.
+    """
+    if(size > SPARSE_BOARD_SIZE):
+        return random_sparse_fleet(size, tuple(ship_lengths), rng)
+
+    return get_placement_index(size, tuple(ship_lengths)).random_fleet(rng)
+
+
+def play_game(strategy1: Strategy,
+              strategy2: Strategy,
+              board1: Board,
+              board2: Board,
+              rng: Random = None) -> Game:
+    """Play a full game in-process where <strategy1> shoots at <board2> and
+    <strategy2> shoots at <board1>. <rng> is handed to both strategies so a
+    seeded generator makes the game reproducible. Returns the finished game.
+    """
+    if(rng is None):
+        rng = Random()
+
+    game = Game(board1, board2)
+    strategies = (strategy1, strategy2)
+
+    strategy1.reset(board2.get_size(),
+                    [ship.get_length() for ship in board2.get_ships()], rng)
+    strategy2.reset(board1.get_size(),
+                    [ship.get_length() for ship in board1.get_ships()], rng)
+
+    while not game.is_over():
+        player = game.get_whos_turn()
+        coordinate = strategies[player].next_shot()
+        result = game.guess(player, coordinate)
+        strategies[player].on_result(coordinate, result)
+
+        if(result == -1):
+            raise ValueError(f"Strategy {strategies[player]} made an invalid "
+                             f"shot at {coordinate}")
+
+    return game
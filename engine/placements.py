@@ -0,0 +1,178 @@
+from array import array
+from functools import lru_cache
+from random import Random
+from typing import Dict, List, Tuple
+
+from players.board import Board, SparseBoard
+from players.ship import Ship
+
+# Boards wider than this are stored sparsely and have no placement index
+SPARSE_BOARD_SIZE = 32
+
+# The number of fleets drawn before random_fleet gives up. A standard fleet
+# fits on a 10 by 10 board about 2 times in 5
+MAX_FLEET_ATTEMPTS = 100000
+
+
+class PlacementIndex(object):
+    """Every legal placement of a set of ship lengths on a board. A placement
+    is a horizontal or vertical line of cells, stored as a bitmask with the
+    cell (x, y) at bit y * size + x like a Board. Indices are shared through
+    get_placement_index, so they are only built once per board size and
+    fleet.
+
+    === Private Attributes ===
+        _size:
+            The width and height of the board.
+        _ship_lengths:
+            The lengths of the ships in the fleet.
+        _masks:
+            Maps each ship length to the bitmasks of all of its placements.
+        _covering:
+            Maps each ship length to a list holding, for every cell, the
+            numbers of the placements in _masks that cover it.
+    """
+    _size: int
+    _ship_lengths: Tuple[int, ...]
+    _masks: Dict[int, List[int]]
+    _covering: Dict[int, List[array]]
+
+    def __init__(self, size: int, ship_lengths: Tuple[int, ...]) -> None:
+        """Enumerate every placement of <ship_lengths> on a <size> by <size>
+        board.
+        """
+        self._size = size
+        self._ship_lengths = ship_lengths
+        self._masks = {}
+        self._covering = {}
+
+        for length in set(ship_lengths):
+            masks = []
+            covering = [array('I') for _ in range(size * size)]
+            line = (1 << length) - 1
+            column = sum(1 << (i * size) for i in range(length))
+
+            for y in range(size):
+                for x in range(size - length + 1):
+                    for i in range(length):
+                        covering[y * size + x + i].append(len(masks))
+                    masks.append(line << (y * size + x))
+
+            for y in range(size - length + 1):
+                for x in range(size):
+                    for i in range(length):
+                        covering[(y + i) * size + x].append(len(masks))
+                    masks.append(column << (y * size + x))
+
+            self._masks[length] = masks
+            self._covering[length] = covering
+
+    def get_size(self) -> int:
+        """Get the width and height of the board."""
+        return self._size
+
+    def get_ship_lengths(self) -> Tuple[int, ...]:
+        """Get the lengths of the ships in the fleet."""
+        return self._ship_lengths
+
+    def get_placements(self, length: int) -> List[int]:
+        """Get the bitmasks of every placement of a ship of <length>."""
+        return self._masks[length]
+
+    def covering(self, coordinate: Tuple[int, int], length: int) -> array:
+        """Get the numbers of the placements of a ship of <length> that cover
+        <coordinate>.
+        """
+        return self._covering[length][int(coordinate[1]) * self._size +
+                                      int(coordinate[0])]
+
+    def consistent(self, length: int, blocked: int) -> List[int]:
+        """Get the numbers of the placements of a ship of <length> that do
+        not cover any cell in the bitmask <blocked>, such as the misses.
+        """
+        return [number for number, mask in enumerate(self._masks[length])
+                if not mask & blocked]
+
+    def get_coordinates(self, mask: int) -> List[Tuple[int, int]]:
+        """Get the coordinates of the cells in the bitmask <mask>."""
+        coordinates = []
+        while mask:
+            index = (mask & -mask).bit_length() - 1
+            coordinates.append((index % self._size, index // self._size))
+            mask &= mask - 1
+        return coordinates
+
+    def random_fleet(self, rng: Random) -> Board:
+        """Create a board holding one ship of every length in the fleet,
+        chosen uniformly among every fleet whose ships do not overlap. Each
+        ship is drawn from all of its placements, and the whole fleet is
+        drawn again when a ship overlaps another one. Placing each ship among
+        the placements left free by the ships before it would never reject a
+        fleet, but it favours fleets whose early ships leave little room.
+        Raises a ValueError if the ships can not all be placed.
+        """
+        for length in self._ship_lengths:
+            if(len(self._masks[length]) == 0):
+                raise ValueError(f"A ship of length {length} does not fit on "
+                                 f"a {self._size} by {self._size} board")
+
+        for _ in range(MAX_FLEET_ATTEMPTS):
+            occupied = 0
+            masks = []
+            for length in self._ship_lengths:
+                placements = self._masks[length]
+                mask = placements[rng.randrange(len(placements))]
+                if(mask & occupied):
+                    break
+
+                occupied |= mask
+                masks.append(mask)
+            else:
+                board = Board(self._size)
+                for mask in masks:
+                    board.add_ship(Ship(self.get_coordinates(mask)))
+                return board
+
+        raise ValueError(f"Could not place ships of lengths "
+                         f"{self._ship_lengths} on a {self._size} by "
+                         f"{self._size} board without overlaps")
+
+
+@lru_cache(maxsize=16)
+def get_placement_index(size: int,
+                        ship_lengths: Tuple[int, ...]) -> PlacementIndex:
+    """Get the shared placement index of <ship_lengths> on a <size> by <size>
+    board, building it on first use.
+    """
+    return PlacementIndex(size, tuple(ship_lengths))
+
+
+def random_sparse_fleet(size: int,
+                        ship_lengths: Tuple[int, ...],
+                        rng: Random) -> SparseBoard:
+    """Create a sparse <size> by <size> board holding one ship of every
+    length in <ship_lengths> at random. Enumerating the placements of a large
+    board is too costly, so random placements are drawn until one does not
+    overlap the ships placed before it. Ships cover a tiny fraction of a
+    large board, so a redraw is rare.
+    """
+    board = SparseBoard(size)
+    occupied = set()
+    for length in ship_lengths:
+        while True:
+            if(rng.random() < 0.5):
+                x = rng.randrange(size - length + 1)
+                y = rng.randrange(size)
+                cells = [(x + i, y) for i in range(length)]
+            else:
+                x = rng.randrange(size)
+                y = rng.randrange(size - length + 1)
+                cells = [(x, y + i) for i in range(length)]
+
+            if(occupied.isdisjoint(cells)):
+                break
+
+        occupied.update(cells)
+        board.add_ship(Ship(cells))
+
+    return board
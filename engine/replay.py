@@ -0,0 +1,311 @@
+from mmap import mmap, ACCESS_READ
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+import os
+import struct
+import time
+
+from players.board import Board, SparseBoard
+from players.ship import Ship
+from engine.game import Game
+from engine.placements import SPARSE_BOARD_SIZE
+
+# game id, player, x, y, result, timestamp
+_RECORD = struct.Struct("<IBIIbd")
+
+# Result codes of records that are not shots. A game is logged as a START
+# record holding the board size in x and y and the first player, then one
+# record per ship cell with the owner of the board as the player and
+# SHIP + the number of the ship as the result, then one record per shot
+# already taken when the game was logged with RESTORED + the result of the
+# shot as the result, then one record per shot.
+RESTORED = 8
+START = 15
+SHIP = 16
+MAX_SHIPS = 127 - SHIP
+
+
+class ReplayRecord(NamedTuple):
+    """A record of the replay log. For shots, <player> is the index of the
+    player who took the shot and <result> is 0 for a miss, 1 for a hit and 2
+    for a sink. <timestamp> is in seconds since the epoch.
+    """
+    game_id: int
+    player: int
+    x: int
+    y: int
+    result: int
+    timestamp: float
+
+
+class ReplayWriter(object):
+    """Appends games to a replay log file. Every record has the same width,
+    so a reader can find any record without parsing the ones before it.
+    Records are packed into a buffer and written in batches, so logging a
+    shot costs a single struct pack.
+
+    The records of a game are never interleaved with the records of another
+    game: game ids increase through the log, and only the game started last
+    can log shots. Readers rely on this to binary search the log by game id,
+    so only one ReplayWriter may append to a log at a time.
+
+    === Private Attributes ===
+        _file:
+            The log file, opened for appending.
+        _buffer:
+            The packed records that have not been written yet.
+        _batch_size:
+            The number of buffered records that triggers a write.
+        _next_game_id:
+            The id given to the next game that is started.
+    """
+    _file: BinaryIO
+    _buffer: bytearray
+    _batch_size: int
+    _next_game_id: int
+
+    def __init__(self, path: str, batch_size: int = 256) -> None:
+        """Open the replay log at <path> for appending, creating it if it
+        does not exist. Records are written every <batch_size> records. A
+        partial record left at the end of the log, such as by a crash while
+        writing, is removed so the records written next stay aligned.
+        """
+        self._file = open(path, "ab")
+        self._buffer = bytearray()
+        self._batch_size = batch_size * _RECORD.size
+
+        size = os.path.getsize(path) // _RECORD.size * _RECORD.size
+        if(size != os.path.getsize(path)):
+            self._file.truncate(size)
+
+        # Game ids keep increasing across runs, so a reader can binary search
+        # the log for a game
+        self._next_game_id = 0
+        if(size > 0):
+            with open(path, "rb") as log:
+                log.seek(size - _RECORD.size)
+                self._next_game_id = \
+                    _RECORD.unpack(log.read(_RECORD.size))[0] + 1
+
+    def start_game(self, game: Game) -> int:
+        """Log the start of <game> with both fleets and the shots already
+        taken in it, such as when a saved game is loaded. Returns the id of
+        the game in the log.
+        """
+        game_id = self._next_game_id
+        self._next_game_id += 1
+
+        size = game.get_size()
+        timestamp = time.time()
+        self._buffer += _RECORD.pack(game_id, game.get_whos_turn(),
+                                     size, size, START, timestamp)
+        for player in range(2):
+            ships = game.get_board(player).get_ships()
+            if(len(ships) > MAX_SHIPS):
+                raise ValueError(
+                    f"A replay log holds at most {MAX_SHIPS} ships a board")
+
+            for number, ship in enumerate(ships):
+                for x, y in ship.get_coordinates():
+                    self._buffer += _RECORD.pack(game_id, player, x, y,
+                                                 SHIP + number, timestamp)
+
+        for player in range(2):
+            for (x, y), result in _restored_shots(game.get_board(player)):
+                self._buffer += _RECORD.pack(game_id, 1 - player, x, y,
+                                             RESTORED + result, timestamp)
+
+        self._write_if_full()
+        return game_id
+
+    def record_shot(self,
+                    game_id: int,
+                    player: int,
+                    coordinate: Tuple[int, int],
+                    result: int) -> None:
+        """Log an accepted shot of player index <player> at <coordinate> in
+        the game <game_id>, with the <result> returned by Game.guess. Raises
+        a ValueError if <game_id> is not the game started last.
+        """
+        if(game_id != self._next_game_id - 1):
+            raise ValueError(f"Game {game_id} is not the game started last "
+                             f"in the replay log")
+
+        self._buffer += _RECORD.pack(game_id, player, coordinate[0],
+                                     coordinate[1], result, time.time())
+        self._write_if_full()
+
+    def flush(self) -> None:
+        """Write every buffered record to the log."""
+        if(len(self._buffer) > 0):
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write every buffered record and close the log."""
+        self.flush()
+        self._file.close()
+
+    def _write_if_full(self) -> None:
+        """Write the buffered records once a batch is full."""
+        if(len(self._buffer) >= self._batch_size):
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+
+class ReplayReader(object):
+    """Reads a replay log written by a ReplayWriter through a memory map, so
+    opening a log, finding a game and seeking to a turn only touch the
+    records that are needed. Games are found by binary search, which relies
+    on the ReplayWriter never interleaving the records of different games.
+    Records written after the reader was opened are not seen.
+
+    === Private Attributes ===
+        _file:
+            The log file.
+        _map:
+            A read only memory map of the log, or None if it is empty.
+        _count:
+            The number of complete records in the log.
+        _games:
+            Maps the id of every game that was looked up to the numbers of
+            its first shot record and the record after its last.
+    """
+    _file: BinaryIO
+    _map: Optional[mmap]
+    _count: int
+    _games: Dict[int, Tuple[int, int]]
+
+    def __init__(self, path: str) -> None:
+        """Open the replay log at <path>."""
+        self._file = open(path, "rb")
+        self._count = os.path.getsize(path) // _RECORD.size
+        self._map = None
+        if(self._count > 0):
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        self._games = {}
+
+    def close(self) -> None:
+        """Close the log."""
+        if(self._map is not None):
+            self._map.close()
+        self._file.close()
+
+    def get_record_count(self) -> int:
+        """Get the number of records in the log."""
+        return self._count
+
+    def record(self, number: int) -> ReplayRecord:
+        """Get the record at <number>."""
+        if(not 0 <= number < self._count):
+            raise IndexError("Replay record out of range")
+        return ReplayRecord(*_RECORD.unpack_from(self._map,
+                                                 number * _RECORD.size))
+
+    def get_turn_count(self, game_id: int) -> int:
+        """Get the number of shots logged for the game <game_id>."""
+        first_shot, end = self._find_game(game_id)
+        return end - first_shot
+
+    def get_shots(self,
+                  game_id: int,
+                  start: int = 0,
+                  stop: int = None) -> List[ReplayRecord]:
+        """Get the records of the shots <start> up to <stop> of the game
+        <game_id>, or up to its last shot if <stop> is None.
+        """
+        first_shot, end = self._find_game(game_id)
+        stop = end - first_shot if stop is None else stop
+        return [self.record(number) for number in
+                range(first_shot + start, min(first_shot + stop, end))]
+
+    def load_game(self, game_id: int, turn: int = None) -> Game:
+        """Rebuild the game <game_id> as it was after its first <turn>
+        logged shots, or after its last shot if <turn> is None. Shots that
+        were already taken when the game was logged are always included.
+        """
+        first_shot, _ = self._find_game(game_id)
+        start = self._game_start(game_id)
+        header = self.record(start)
+
+        size = header.x
+        boards = [SparseBoard(size) if size > SPARSE_BOARD_SIZE
+                  else Board(size) for _ in range(2)]
+        cells = [{}, {}]
+        restored = []
+        for number in range(start + 1, first_shot):
+            record = self.record(number)
+            if(record.result >= SHIP):
+                cells[record.player].setdefault(record.result, []) \
+                    .append((record.x, record.y))
+            else:
+                restored.append(record)
+        for player in range(2):
+            for number in sorted(cells[player]):
+                boards[player].add_ship(Ship(cells[player][number]))
+
+        for record in restored:
+            boards[1 - record.player].shoot((record.x, record.y))
+
+        whos_turn = header.player
+        for record in self.get_shots(game_id, 0, turn):
+            boards[1 - record.player].shoot((record.x, record.y))
+            whos_turn = 1 - record.player
+
+        return Game(boards[0], boards[1], whos_turn)
+
+    def _find_game(self, game_id: int) -> Tuple[int, int]:
+        """Get the number of the first shot record of the game <game_id> and
+        the number of the record after its last. Raises a KeyError if the
+        game is not in the log.
+        """
+        if(game_id not in self._games):
+            start = self._game_start(game_id)
+            first_shot = start + 1
+            while(first_shot < self._count and
+                  self.record(first_shot).result >= RESTORED and
+                  self.record(first_shot).game_id == game_id):
+                first_shot += 1
+
+            end = self._first_record(game_id + 1)
+            self._games[game_id] = (first_shot, end)
+
+        return self._games[game_id]
+
+    def _game_start(self, game_id: int) -> int:
+        """Get the number of the START record of the game <game_id>."""
+        start = self._first_record(game_id)
+        if(start == self._count or self.record(start).game_id != game_id):
+            raise KeyError(f"Game {game_id} is not in the replay log")
+        return start
+
+    def _first_record(self, game_id: int) -> int:
+        """Get the number of the first record whose game id is at least
+        <game_id>, by binary search since game ids increase through the log.
+        """
+        low = 0
+        high = self._count
+        while(low < high):
+            middle = (low + high) // 2
+            if(_RECORD.unpack_from(self._map, middle * _RECORD.size)[0]
+               < game_id):
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+
+def _restored_shots(board: Board) -> List[Tuple[Tuple[int, int], int]]:
+    """Get the coordinate and result of every shot taken at <board>. The
+    order of the shots is not known, so the shot that sunk each ship is
+    taken to be the last cell of the ship and is given after the others.
+    """
+    sinking_shots = [ship.get_coordinates()[-1]
+                     for ship in board.get_ships() if ship.is_sunk()]
+    sinking_cells = set(sinking_shots)
+
+    shots = [((x, y), int(hit)) for x, y, hit in board.get_shots()
+             if (x, y) not in sinking_cells]
+    shots.extend((coordinate, 2) for coordinate in sinking_shots)
+    return shots
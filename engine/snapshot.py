@@ -0,0 +1,140 @@
+import struct
+
+from players.board import Board, SparseBoard
+from players.ship import Ship
+from engine.game import Game
+from engine.placements import SPARSE_BOARD_SIZE
+
+# Identifies a snapshot and the version of its layout
+MAGIC = b"BSHP"
+VERSION = 2
+
+# magic, version, player index whose turn it is, board size
+_HEADER = struct.Struct("<4sBBI")
+
+# Number of ships on a board, then each ship's length
+_COUNT = struct.Struct("<H")
+_LENGTH = struct.Struct("<B")
+
+# Number of hits or misses on a sparse board
+_SHOT_COUNT = struct.Struct("<I")
+
+
+def save_game(game: Game) -> bytes:
+    """Return a compact binary snapshot of <game>.
+
+    The snapshot is a fixed header followed by one section per player. A
+    section holds the player's ships as lists of cell indices, then a hit
+    plane and a miss plane with one bit per cell, the cell (x, y) being bit
+    y * size + x as in a Board. A 10 by 10 game takes about 120 bytes.
+    Boards wider than SPARSE_BOARD_SIZE store a list of the indices of their
+    hits and one of their misses instead of the planes, so their snapshot
+    grows with the number of ships and shots rather than with the area of
+    the board.
+    """
+    size = game.get_size()
+    cell_format = _cell_format(size)
+    plane_size = (size * size + 7) // 8
+
+    parts = [_HEADER.pack(MAGIC, VERSION, game.get_whos_turn(), size)]
+    for player in range(2):
+        board = game.get_board(player)
+        ships = board.get_ships()
+
+        parts.append(_COUNT.pack(len(ships)))
+        for ship in ships:
+            cells = [board.index(coordinate)
+                     for coordinate in ship.get_coordinates()]
+            parts.append(_LENGTH.pack(len(cells)))
+            parts.append(struct.pack(f"<{len(cells)}{cell_format}", *cells))
+
+        if(size > SPARSE_BOARD_SIZE):
+            shots = board.get_shots()
+            for is_hit in (True, False):
+                cells = [board.index((x, y)) for x, y, hit in shots
+                         if hit is is_hit]
+                parts.append(_SHOT_COUNT.pack(len(cells)))
+                parts.append(struct.pack(f"<{len(cells)}{cell_format}",
+                                         *cells))
+        else:
+            parts.append(board.get_hit_mask().to_bytes(plane_size, "little"))
+            parts.append(board.get_miss_mask().to_bytes(plane_size,
+                                                        "little"))
+
+    return b"".join(parts)
+
+
+def load_game(data: bytes) -> Game:
+    """Return the game stored in the snapshot <data>. Snapshots of version 1
+    store the planes of every board. Raises a ValueError if <data> is not a
+    snapshot, was written by an unknown version or is truncated.
+    """
+    try:
+        return _load_game(data)
+    except struct.error:
+        raise ValueError("Snapshot data is truncated") from None
+
+
+def _load_game(data: bytes) -> Game:
+    """Return the game stored in the snapshot <data>. Raises a struct.error
+    if a count or a list of cells is cut off, and a ValueError for any other
+    problem.
+    """
+    magic, version, turn, size = _HEADER.unpack_from(data, 0)
+    if(magic != MAGIC):
+        raise ValueError("Data is not a Battleships snapshot")
+    if(version not in (1, VERSION)):
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    cell_format = _cell_format(size)
+    cell_size = struct.calcsize(cell_format)
+    plane_size = (size * size + 7) // 8
+    has_shot_lists = version >= 2 and size > SPARSE_BOARD_SIZE
+    offset = _HEADER.size
+
+    boards = []
+    for player in range(2):
+        board = SparseBoard(size) if size > SPARSE_BOARD_SIZE else Board(size)
+
+        ship_count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(ship_count):
+            length, = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            cells = struct.unpack_from(f"<{length}{cell_format}", data, offset)
+            offset += length * cell_size
+            board.add_ship(Ship([board.coordinate(cell) for cell in cells]))
+
+        if(has_shot_lists):
+            shots = []
+            for _ in range(2):
+                count, = _SHOT_COUNT.unpack_from(data, offset)
+                offset += _SHOT_COUNT.size
+                shots.append(list(struct.unpack_from(
+                    f"<{count}{cell_format}", data, offset)))
+                offset += count * cell_size
+            board.restore_shot_indices(shots[0], shots[1])
+        else:
+            if(offset + 2 * plane_size > len(data)):
+                raise ValueError("Snapshot data is truncated")
+            board.restore_shots(
+                data[offset:offset + plane_size],
+                data[offset + plane_size:offset + 2 * plane_size])
+            offset += 2 * plane_size
+
+        boards.append(board)
+
+    return Game(boards[0], boards[1], turn)
+
+
+def _cell_format(size: int) -> str:
+    """Return the struct format of the smallest integer that can hold the
+    index of every cell of a <size> by <size> board.
+    """
+    if(size * size <= 1 << 8):
+        return "B"
+    if(size * size <= 1 << 16):
+        return "H"
+    if(size * size <= 1 << 32):
+        return "I"
+    return "Q"
@@ -0,0 +1,396 @@
+from collections import Counter
+from heapq import heappop, heappush
+from random import Random
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+
+class Strategy(object):
+    """Chooses the shots for one side of a Battleships game. Subclasses are
+    used both by the headless engine and by computer players.
+    """
+
+    def reset(self,
+              size: int,
+              ship_lengths: List[int],
+              rng: Random) -> None:
+        """Prepare for a new game against a <size> by <size> board holding
+        ships of <ship_lengths>. <rng> is the source of all randomness.
+        """
+        pass
+
+    def next_shot(self) -> Tuple[int, int]:
+        """Return the coordinate of the next shot to take. Raises a
+        ValueError if every cell has been shot.
+        """
+        raise NotImplementedError
+
+    def on_result(self, coordinate: Tuple[int, int], result: int) -> None:
+        """Called with the <result> of the shot at <coordinate>, using the
+        same codes as GameManager.guess.
+        """
+        pass
+
+
+class RandomStrategy(Strategy):
+    """Shoots at a uniformly random cell that has not been shot yet. The
+    cells are shuffled lazily, one draw per shot, and only the swapped
+    positions are stored, so memory grows with the number of shots rather
+    than with the area of the board.
+
+    === Private Attributes ===
+        _size:
+            The width and height of the board being shot at.
+        _unshot_count:
+            The number of cells that have not been shot yet.
+        _swapped:
+            The cell now held by each position of the shuffle that differs
+            from its initial cell. Positions below _unshot_count hold the
+            cells that have not been shot.
+        _rng:
+            The source of randomness.
+    """
+    _size: int
+    _unshot_count: int
+    _swapped: Dict[int, int]
+    _rng: Random
+
+    def __init__(self) -> None:
+        """Create a new RandomStrategy."""
+        self._size = 0
+        self._unshot_count = 0
+        self._swapped = {}
+        self._rng = Random()
+
+    def reset(self,
+              size: int,
+              ship_lengths: List[int],
+              rng: Random) -> None:
+        """Mark every cell of a <size> by <size> board as not shot."""
+        self._size = size
+        self._unshot_count = size * size
+        self._swapped = {}
+        self._rng = rng
+
+    def next_shot(self) -> Tuple[int, int]:
+        """Pick a random cell that has not been shot and remove it from the
+        candidates by swapping it with the last one. Raises a ValueError if
+        every cell has been shot.
+        """
+        if(self._unshot_count == 0):
+            raise ValueError("Every cell has been shot")
+
+        i = self._rng.randrange(self._unshot_count)
+        last = self._unshot_count - 1
+        index = self._swapped.get(i, i)
+        self._swapped[i] = self._swapped.pop(last, last)
+        self._unshot_count = last
+        return (index % self._size, index // self._size)
+
+
+class ProbabilityStrategy(Strategy):
+    """Shoots at the cell covered by the most ship placements that are still
+    possible. While no wounded ship is known it hunts with the density of
+    every placement avoiding misses and sunken ships. Once a ship is hit, it
+    targets the cells of the placements passing through the hits.
+
+    The density is never recomputed. Without shots, the density of (x, y) is
+    the sum of a count for x and a count for y, so unshot cells are visited in
+    order of density by walking the two sorted counts. A miss only removes
+    the placements passing through it, which touches a number of cells that
+    depends on the ship lengths but not on the board size. The touched cells
+    are kept in a heap with stale entries skipped lazily, so a move costs
+    O(log n) for an n by n board.
+
+    === Private Attributes ===
+        _size:
+            The width and height of the board being shot at.
+        _rng:
+            The source of randomness, used to break ties.
+        _counts:
+            The number of ships of each length in the enemy fleet.
+        _lengths_left:
+            The lengths of the enemy ships that have not been sunk.
+        _line_density:
+            The number of placements covering each position of a row when no
+            shots have been taken. The density of cell (x, y) starts as
+            _line_density[x] + _line_density[y].
+        _removed:
+            The number of placements that have been ruled out for each
+            touched cell.
+        _shot:
+            The indices of every cell that has been shot.
+        _blocked:
+            The indices of every cell that can not hold an afloat ship.
+        _hits:
+            The indices of the hits that are not part of a sunken ship.
+        _touched:
+            A heap of (-density, tie breaker, cell index) for the touched
+            cells. Entries whose density changed since they were pushed are
+            skipped.
+        _x_order:
+            The x positions sorted by decreasing line density.
+        _y_order:
+            The y positions sorted by decreasing line density.
+        _frontier:
+            A heap of (-density, i, j) walking the untouched cells
+            (_x_order[i], _y_order[j]) in decreasing order of density.
+    """
+    _size: int
+    _rng: Random
+    _counts: Dict[int, int]
+    _lengths_left: List[int]
+    _line_density: List[int]
+    _removed: Dict[int, int]
+    _shot: Set[int]
+    _blocked: Set[int]
+    _hits: Set[int]
+    _touched: List[Tuple[int, float, int]]
+    _x_order: List[int]
+    _y_order: List[int]
+    _frontier: List[Tuple[int, int, int]]
+
+    def __init__(self) -> None:
+        """Create a new ProbabilityStrategy."""
+        self.reset(0, [], Random())
+
+    def reset(self,
+              size: int,
+              ship_lengths: List[int],
+              rng: Random) -> None:
+        """Set up the initial density for a <size> by <size> board holding
+        ships of <ship_lengths>.
+        """
+        self._size = size
+        self._rng = rng
+        self._counts = Counter(length for length in ship_lengths
+                               if 0 < length <= size)
+        self._lengths_left = list(ship_lengths)
+        self._removed = {}
+        self._shot = set()
+        self._blocked = set()
+        self._hits = set()
+        self._touched = []
+
+        # The placements of a ship of length L along a row that cover
+        # position p start anywhere from max(0, p - L + 1) to min(p, size - L)
+        self._line_density = [
+            sum(count * (min(p, size - length) - max(0, p - length + 1) + 1)
+                for length, count in self._counts.items())
+            for p in range(size)]
+
+        self._x_order = self._sorted_positions()
+        self._y_order = self._sorted_positions()
+        self._frontier = []
+        if(size > 0):
+            self._frontier.append((-2 * self._line_density[
+                self._x_order[0]], 0, 0))
+
+    def next_shot(self) -> Tuple[int, int]:
+        """Return the unshot cell with the highest density. Raises a
+        ValueError if every cell has been shot.
+        """
+        cell = None
+        if(len(self._hits) > 0):
+            cell = self._target()
+
+        if(cell is None):
+            cell = self._hunt()
+
+        self._shot.add(cell)
+        return (cell % self._size, cell // self._size)
+
+    def on_result(self, coordinate: Tuple[int, int], result: int) -> None:
+        """Rule out the placements that the shot at <coordinate> proved
+        impossible.
+        """
+        cell = int(coordinate[1]) * self._size + int(coordinate[0])
+        self._shot.add(cell)
+
+        if(result == 0):
+            self._block(cell)
+
+        elif(result == 1):
+            self._hits.add(cell)
+
+        elif(result == 2):
+            self._hits.add(cell)
+            self._resolve_sunk(cell)
+
+    def _sorted_positions(self) -> List[int]:
+        """Return every position of a row sorted by decreasing line density,
+        with ties in random order.
+        """
+        positions = list(range(self._size))
+        self._rng.shuffle(positions)
+        positions.sort(key=lambda p: -self._line_density[p])
+        return positions
+
+    def _density(self, cell: int) -> int:
+        """Return the number of possible placements covering <cell>."""
+        return self._line_density[cell % self._size] + \
+            self._line_density[cell // self._size] - \
+            self._removed.get(cell, 0)
+
+    def _placements(self, cell: int, length: int) -> List[range]:
+        """Return the cell indices of every placement of a ship of <length>
+        that covers <cell>.
+        """
+        size = self._size
+        x = cell % size
+        y = cell // size
+        placements = []
+
+        for start in range(max(0, x - length + 1), min(x, size - length) + 1):
+            placements.append(range(y * size + start,
+                                    y * size + start + length))
+
+        for start in range(max(0, y - length + 1), min(y, size - length) + 1):
+            placements.append(range(start * size + x,
+                                    (start + length) * size + x, size))
+
+        return placements
+
+    def _block(self, cell: int) -> None:
+        """Mark <cell> as unable to hold an afloat ship and remove the
+        placements covering it from the density of their cells.
+        """
+        if(cell in self._blocked):
+            return
+
+        for length, count in self._counts.items():
+            for placement in self._placements(cell, length):
+                if(any(other in self._blocked for other in placement)):
+                    continue
+
+                for other in placement:
+                    self._removed[other] = self._removed.get(other, 0) + count
+                    if(other not in self._shot):
+                        heappush(self._touched, (-self._density(other),
+                                                 self._rng.random(), other))
+
+        self._blocked.add(cell)
+
+    def _hunt(self) -> int:
+        """Return the unshot cell with the highest density. Raises a
+        ValueError if every cell has been shot.
+        """
+        touched = self._peek_touched()
+        untouched = self._peek_untouched()
+
+        if(touched is None and untouched is None):
+            raise ValueError("Every cell has been shot")
+
+        if(untouched is None or
+           (touched is not None and touched[0] >= untouched[0])):
+            return touched[1]
+        return untouched[1]
+
+    def _peek_touched(self) -> Optional[Tuple[int, int]]:
+        """Return the density and index of the densest touched unshot cell,
+        discarding stale heap entries.
+        """
+        while len(self._touched) > 0:
+            density, _, cell = self._touched[0]
+            if(cell not in self._shot and -density == self._density(cell)):
+                return (-density, cell)
+            heappop(self._touched)
+
+        return None
+
+    def _peek_untouched(self) -> Optional[Tuple[int, int]]:
+        """Return the density and index of the densest untouched unshot cell,
+        skipping cells that have been touched or shot.
+        """
+        while len(self._frontier) > 0:
+            density, i, j = self._frontier[0]
+            cell = self._y_order[j] * self._size + self._x_order[i]
+            if(cell not in self._shot and cell not in self._removed):
+                return (-density, cell)
+
+            # Every pair (i, j) is reached once: from (i, j - 1), or from
+            # (i - 1, 0) when j is 0
+            heappop(self._frontier)
+            if(j + 1 < self._size):
+                heappush(self._frontier, (-(
+                    self._line_density[self._x_order[i]] +
+                    self._line_density[self._y_order[j + 1]]), i, j + 1))
+
+            if(j == 0 and i + 1 < self._size):
+                heappush(self._frontier, (-(
+                    self._line_density[self._x_order[i + 1]] +
+                    self._line_density[self._y_order[0]]), i + 1, 0))
+
+        return None
+
+    def _target(self) -> Optional[int]:
+        """Return the unshot cell covered by the most possible placements of
+        the remaining ships through the known hits, or None if there are
+        none.
+        """
+        scores = {}
+        for hit in self._hits:
+            for length, count in Counter(self._lengths_left).items():
+                for placement in self._placements(hit, length):
+                    if(any(cell in self._blocked for cell in placement)):
+                        continue
+
+                    weight = count * sum(cell in self._hits
+                                         for cell in placement)
+                    for cell in placement:
+                        if(cell not in self._shot):
+                            scores[cell] = scores.get(cell, 0) + weight
+
+        if(len(scores) == 0):
+            return None
+
+        return max(scores, key=lambda cell: (scores[cell], self._rng.random()))
+
+    def _resolve_sunk(self, cell: int) -> None:
+        """Mark the line of hits through <cell>, which just sunk a ship, as
+        that ship.
+        """
+        x = cell % self._size
+        y = cell // self._size
+        ship = []
+
+        for dx, dy in ((1, 0), (0, 1)):
+            run = [cell]
+            for direction in (1, -1):
+                step = 1
+                while True:
+                    rx = x + dx * step * direction
+                    ry = y + dy * step * direction
+                    other = ry * self._size + rx
+                    if(not (0 <= rx < self._size and 0 <= ry < self._size) or
+                       other not in self._hits):
+                        break
+                    run.append(other)
+                    step += 1
+
+            if(len(run) > len(ship)):
+                ship = run
+
+        if(len(ship) in self._lengths_left):
+            self._lengths_left.remove(len(ship))
+
+        for other in ship:
+            self._hits.discard(other)
+            self._block(other)
+
+
+# Strategies available to tournaments and computer players, by name
+STRATEGIES: Dict[str, Type[Strategy]] = {}
+
+
+def register_strategy(name: str, strategy: Type[Strategy]) -> None:
+    """Make <strategy> available to tournaments under <name>."""
+    STRATEGIES[name] = strategy
+
+
+def create_strategy(name: str) -> Strategy:
+    """Create a new instance of the strategy registered under <name>."""
+    return STRATEGIES[name]()
+
+
+register_strategy("random", RandomStrategy)
+register_strategy("probability", ProbabilityStrategy)
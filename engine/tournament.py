@@ -0,0 +1,165 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+from random import Random
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple
+import argparse
+import os
+
+from engine.game import DEFAULT_SHIP_LENGTHS, play_game, random_fleet
+from engine.strategy import STRATEGIES, create_strategy
+
+
+class GameResult(NamedTuple):
+    """The outcome of one tournament game."""
+    game: int
+    player1: str
+    player2: str
+    winner: str
+    shots: int
+
+
+class Standing(object):
+    """The aggregated results of one strategy in a tournament.
+
+    === Public Attributes ===
+        games:
+            The number of games the strategy played.
+        wins:
+            The number of games the strategy won.
+        winning_shots:
+            The total number of shots the strategy took in the games it won.
+    """
+    games: int
+    wins: int
+    winning_shots: int
+
+    def __init__(self) -> None:
+        """Create a new Standing with no games played."""
+        self.games = 0
+        self.wins = 0
+        self.winning_shots = 0
+
+    def get_win_rate(self) -> float:
+        """Return the fraction of games the strategy won."""
+        if(self.games == 0):
+            return 0
+        return self.wins / self.games
+
+    def get_average_shots_to_win(self) -> float:
+        """Return the average number of shots the strategy took to win."""
+        if(self.wins == 0):
+            return float("nan")
+        return self.winning_shots / self.wins
+
+
+def play_games(player1: str,
+               player2: str,
+               first_game: int,
+               count: int,
+               seed: int,
+               size: int,
+               ship_lengths: Tuple[int, ...]) -> List[GameResult]:
+    """Play <count> games between the strategies registered as <player1> and
+    <player2>, numbered from <first_game>. Each game gets its own generator
+    seeded from <seed> and its number, so results do not depend on which
+    process plays the game or in what order. The strategies take turns
+    shooting first.
+    """
+    results = []
+    for game in range(first_game, first_game + count):
+        rng = Random(seed * 1000003 + game)
+        names = (player1, player2) if game % 2 == 0 else (player2, player1)
+
+        board1 = random_fleet(size, ship_lengths, rng)
+        board2 = random_fleet(size, ship_lengths, rng)
+        played = play_game(create_strategy(names[0]),
+                           create_strategy(names[1]),
+                           board1, board2, rng)
+
+        winner = played.get_winner()
+        results.append(GameResult(game, names[0], names[1], names[winner],
+                                  played.get_shots(winner)))
+    return results
+
+
+def iter_tournament(strategies: List[str],
+                    games_per_pair: int,
+                    seed: int = 0,
+                    size: int = 10,
+                    ship_lengths: Tuple[int, ...] = DEFAULT_SHIP_LENGTHS,
+                    workers: int = None,
+                    chunk_size: int = 64) -> Iterator[GameResult]:
+    """Play <games_per_pair> games between every pair of <strategies> and
+    yield each result as soon as its process finishes it. Games are handed
+    to a pool of <workers> processes, one per CPU if None, in chunks of
+    <chunk_size> games.
+    """
+    if(workers is None):
+        workers = os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        game = 0
+        for player1, player2 in combinations(strategies, 2):
+            for first in range(0, games_per_pair, chunk_size):
+                count = min(chunk_size, games_per_pair - first)
+                futures.append(executor.submit(
+                    play_games, player1, player2, game, count, seed, size,
+                    tuple(ship_lengths)))
+                game += count
+
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def run_tournament(strategies: List[str],
+                   games_per_pair: int,
+                   on_result: Callable[[GameResult], None] = None,
+                   **kwargs) -> Dict[str, Standing]:
+    """Play a round robin tournament between <strategies> and return the
+    standing of each one. <on_result> is called with every result as it
+    arrives. Any other keyword arguments are passed to iter_tournament.
+    """
+    standings = {name: Standing() for name in strategies}
+    for result in iter_tournament(strategies, games_per_pair, **kwargs):
+        standings[result.player1].games += 1
+        standings[result.player2].games += 1
+        standings[result.winner].wins += 1
+        standings[result.winner].winning_shots += result.shots
+
+        if(on_result is not None):
+            on_result(result)
+
+    return standings
+
+
+def main() -> None:
+    """Run a tournament from the command line and print the standings."""
+    parser = argparse.ArgumentParser(
+        description="Play a round robin tournament between computer "
+                    "strategies.")
+    parser.add_argument("strategies", nargs="*", default=sorted(STRATEGIES),
+                        help="registered strategy names, all if omitted")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="games played between each pair")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    strategies = list(dict.fromkeys(args.strategies))
+    if(len(strategies) < 2):
+        parser.error("a tournament needs at least two different strategies")
+
+    standings = run_tournament(strategies, args.games, seed=args.seed,
+                               size=args.size, workers=args.workers)
+
+    print(f"{'strategy':<16}{'games':>8}{'win rate':>10}{'shots/win':>11}")
+    for name, standing in standings.items():
+        print(f"{name:<16}{standing.games:>8}"
+              f"{standing.get_win_rate():>10.3f}"
+              f"{standing.get_average_shots_to_win():>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,20 @@
+import logging
+import sys
+import time
+
 from managers.scene_manager import SceneManager
 from managers.event_manager import EventManager
 from managers.game_manager import GameManager
 from managers.audio_manager import AudioManager
+from managers.asset_manager import AssetManager
 
 if __name__ == '__main__':
+    start_time = time.perf_counter()
+    if("--debug" in sys.argv):
+        logging.basicConfig(level=logging.DEBUG)
+
+    AssetManager()
     AudioManager()
     GameManager()
     EventManager()
-    SceneManager()
+    SceneManager(start_time)
@@ -0,0 +1,530 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (Deque, Dict, Hashable, Iterable, List, NamedTuple,
+                    Optional, Sequence, Tuple)
+import os
+import time
+
+from pygame import SRCALPHA, Surface, font, image, mixer, transform
+
+from util.asset_bundle import (BUNDLE_EXTENSION, get_bundle_path,
+                               is_bundle_current, read_bundle)
+
+# The default number of bytes of pixel data kept by the scaled surface cache
+DEFAULT_SCALED_BUDGET = 64 * 1024 * 1024
+
+# The default number of bytes of pixel data kept by the rendered text cache
+DEFAULT_TEXT_BUDGET = 4 * 1024 * 1024
+
+# The number of worker threads that decode preloaded files
+PRELOAD_WORKERS = 4
+
+
+class CacheStats(NamedTuple):
+    """The counters of the scaled surface cache. <memory> and <budget> are
+    in bytes of pixel data.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    memory: int
+    budget: int
+
+
+class AssetManager(object):
+    """A Singleton that loads the images of the game. The static instance
+    variable can be used to access this object. This class must be created
+    atleast once. Every image and animation folder is decoded once and
+    shared by every component that asks for it, so scene changes do not read
+    from the disk. Scaled copies of images are kept in a least recently used
+    cache within a memory budget, so redraws and resizes do not scale the
+    same image again. Shared and scaled images must not be modified.
+
+    Fonts are shared by face and size, and rendered text is kept in its own
+    least recently used cache, so labels that show the same strings again do
+    not rasterize them again. Shared fonts and rendered text must not be
+    modified either.
+    Animation folders that have an up to date bundle, built by
+    util/asset_bundle.py, are loaded from the bundle instead of decoding
+    every frame.
+
+    Images, animation folders and sounds can be preloaded. Their files are
+    decoded on worker threads while the game keeps running, and images are
+    converted for drawing on the main thread by update. Requesting an asset
+    that is still being decoded waits for it.
+
+    === Private Attributes ===
+        _images:
+            Maps the path of every loaded image to the image.
+        _animations:
+            Maps the path of every loaded animation folder to its frames,
+            sorted by filename.
+        _uses:
+            Maps the path of every requested image or folder to the number
+            of times it was requested.
+        _load_count:
+            The number of image, bundle and sound files read from the disk.
+        _asset_ids:
+            Maps the id of every loaded image to its path and its index in
+            its animation, or 0 for single images.
+        _scaled:
+            The scaled surface cache, from least to most recently used. Maps
+            (asset id, frame index, size, filter) to the scaled surface and
+            the surface it was scaled from.
+        _scaled_memory:
+            The number of bytes of pixel data held by _scaled.
+        _scaled_budget:
+            The number of bytes of pixel data _scaled may hold.
+        _hits:
+            The number of scaled surfaces found in _scaled.
+        _misses:
+            The number of scaled surfaces that had to be scaled.
+        _evictions:
+            The number of scaled surfaces removed to stay within the budget.
+        _sounds:
+            Maps the path of every loaded sound to the sound.
+        _fonts:
+            Maps the face and size of every requested font to the font.
+        _text:
+            The rendered text cache, from least to most recently used. Maps
+            (font id, text, antialias, color) to the rendered text and the
+            font it was rendered with.
+        _text_memory:
+            The number of bytes of pixel data held by _text.
+        _text_budget:
+            The number of bytes of pixel data _text may hold.
+        _text_hits:
+            The number of rendered texts found in _text.
+        _text_misses:
+            The number of texts that had to be rendered.
+        _text_evictions:
+            The number of rendered texts removed to stay within the budget.
+        _executor:
+            The worker threads that decode preloaded files, or None if
+            nothing was preloaded.
+        _decoding:
+            Maps the path of every preloaded file that has not been taken by
+            the main thread yet to its decoded image or sound.
+        _preloaded:
+            Maps the path of every preloaded asset to the paths of its files.
+        _preload_queue:
+            The preloaded assets that update has not converted yet, in the
+            order they were preloaded.
+    """
+    instance = None
+
+    _images: Dict[str, Surface]
+    _animations: Dict[str, Tuple[Surface, ...]]
+    _uses: Dict[str, int]
+    _load_count: int
+    _asset_ids: Dict[int, Tuple[str, int]]
+    _scaled: Dict[Tuple[Hashable, int, Tuple[int, int], str],
+                  Tuple[Surface, Surface]]
+    _scaled_memory: int
+    _scaled_budget: int
+    _hits: int
+    _misses: int
+    _evictions: int
+    _sounds: Dict[str, mixer.Sound]
+    _fonts: Dict[Tuple[Optional[str], int], font.Font]
+    _text: Dict[Tuple[int, str, bool, Tuple[int, ...]],
+                Tuple[Surface, font.Font]]
+    _text_memory: int
+    _text_budget: int
+    _text_hits: int
+    _text_misses: int
+    _text_evictions: int
+    _executor: Optional[ThreadPoolExecutor]
+    _decoding: Dict[str, Future]
+    _preloaded: Dict[str, List[str]]
+    _preload_queue: Deque[str]
+
+    def __init__(self,
+                 scaled_budget: int = DEFAULT_SCALED_BUDGET,
+                 text_budget: int = DEFAULT_TEXT_BUDGET) -> None:
+        """Create a new AssetManager and setup the static instance variable.
+        <scaled_budget> and <text_budget> are the number of bytes of pixel
+        data the scaled surface cache and the rendered text cache may hold.
+        """
+        if(AssetManager.instance is None):
+            AssetManager.instance = self
+
+        self._images = {}
+        self._animations = {}
+        self._uses = {}
+        self._load_count = 0
+        self._asset_ids = {}
+        self._scaled = OrderedDict()
+        self._scaled_memory = 0
+        self._scaled_budget = scaled_budget
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._sounds = {}
+        self._fonts = {}
+        self._text = OrderedDict()
+        self._text_memory = 0
+        self._text_budget = text_budget
+        self._text_hits = 0
+        self._text_misses = 0
+        self._text_evictions = 0
+        self._executor = None
+        self._decoding = {}
+        self._preloaded = {}
+        self._preload_queue = deque()
+
+    def get_image(self, path: str) -> Surface:
+        """Get the image at <path>, converted for fast drawing. The image is
+        only loaded from the disk the first time it is requested.
+        """
+        self._uses[path] = self._uses.get(path, 0) + 1
+
+        if(path not in self._images):
+            self._images[path] = self._load(path, path, 0)
+
+        return self._images[path]
+
+    def get_animation(self, folder_path: str) -> Tuple[Surface, ...]:
+        """Get the frames of the animation in <folder_path>, sorted by
+        filename in ascending order. The frames are only loaded from the disk
+        the first time the folder is requested.
+        """
+        self._uses[folder_path] = self._uses.get(folder_path, 0) + 1
+
+        if(folder_path not in self._animations):
+            self._animations[folder_path] = \
+                self._load_animation(folder_path)
+
+        return self._animations[folder_path]
+
+    def get_sound(self, path: str) -> mixer.Sound:
+        """Get the sound at <path>. The sound is only loaded from the disk the
+        first time it is requested. The mixer must be initialized.
+        """
+        self._uses[path] = self._uses.get(path, 0) + 1
+
+        if(path not in self._sounds):
+            future = self._decoding.pop(path, None)
+            if(future is None):
+                self._load_count += 1
+                self._sounds[path] = mixer.Sound(path)
+            else:
+                self._sounds[path] = future.result()
+
+        return self._sounds[path]
+
+    def get_font(self, face: Optional[str], size: int) -> font.Font:
+        """Get the font in the file <face>, or pygame's default font if
+        <face> is None, at <size>. Every font is only created once. The font
+        module must be initialized.
+        """
+        key = (face, size)
+        if(key not in self._fonts):
+            self._fonts[key] = font.Font(face, size)
+
+        return self._fonts[key]
+
+    def render_text(self,
+                    text_font: font.Font,
+                    text: str,
+                    antialias: bool,
+                    color: Sequence[int]) -> Surface:
+        """Get <text> rendered with <text_font> in <color>, with smooth edges
+        if <antialias>. Texts are only rendered the first time they are
+        requested, until they are evicted from the cache.
+        """
+        key = (id(text_font), text, antialias, tuple(color))
+
+        entry = self._text.get(key)
+        if(entry is not None and entry[1] is text_font):
+            self._text_hits += 1
+            self._text.move_to_end(key)
+            return entry[0]
+
+        self._text_misses += 1
+        rendered = text_font.render(text, antialias, color)
+
+        if(entry is not None):
+            self._remove_text(key)
+
+        memory = _memory(rendered)
+        if(memory <= self._text_budget):
+            self._text[key] = (rendered, text_font)
+            self._text_memory += memory
+            while(self._text_memory > self._text_budget):
+                self._remove_text(next(iter(self._text)))
+                self._text_evictions += 1
+
+        return rendered
+
+    def get_text_cache_stats(self) -> CacheStats:
+        """Get the counters of the rendered text cache."""
+        return CacheStats(self._text_hits, self._text_misses,
+                          self._text_evictions, len(self._text),
+                          self._text_memory, self._text_budget)
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """Start decoding the images, animation folders and sounds at <paths>
+        on worker threads. Paths ending in .wav are sounds, and the mixer
+        must be initialized to preload them. Assets that were already loaded
+        or preloaded are skipped.
+        """
+        if(self._executor is None):
+            self._executor = ThreadPoolExecutor(
+                PRELOAD_WORKERS, thread_name_prefix="asset-preload")
+
+        for path in paths:
+            if(path in self._preloaded or self._is_loaded(path)):
+                continue
+
+            files = [path]
+            if(os.path.isdir(path)):
+                files = _get_animation_files(path)
+
+            for file in files:
+                self._decoding[file] = self._executor.submit(_decode, file)
+                self._load_count += 1
+
+            self._preloaded[path] = files
+            self._preload_queue.append(path)
+
+    def is_ready(self, paths: Iterable[str]) -> bool:
+        """Return whether every asset at <paths> can be requested without
+        waiting for the disk. Assets that were not preloaded are only ready
+        once they are loaded.
+        """
+        return all(self._is_loaded(path) or
+                   (path in self._preloaded and
+                    all(self._is_decoded(file)
+                        for file in self._preloaded[path]))
+                   for path in paths)
+
+    def get_progress(self, paths: Iterable[str] = None) -> float:
+        """Get the fraction of the files of the preloaded assets at <paths>,
+        or of every preloaded asset if <paths> is None, that are decoded.
+        """
+        if(paths is None):
+            paths = self._preloaded.keys()
+
+        files = [file for path in paths
+                 for file in self._preloaded.get(path, ())]
+        if(len(files) == 0):
+            return 1.0
+
+        return sum(self._is_decoded(file) for file in files) / len(files)
+
+    def update(self, budget: float = 4) -> None:
+        """Convert the preloaded assets that are decoded for drawing, in the
+        order they were preloaded, for at most about <budget> miliseconds.
+        Called once per frame by the game loop.
+        """
+        end = time.perf_counter() + budget / 1000
+        while(len(self._preload_queue) > 0 and time.perf_counter() < end):
+            path = self._preload_queue[0]
+            if(not all(self._is_decoded(file)
+                       for file in self._preloaded[path])):
+                return
+
+            self._preload_queue.popleft()
+            if(self._is_loaded(path)):
+                continue
+
+            if(path.endswith(".wav")):
+                self._sounds[path] = self._decoding.pop(path).result()
+            elif(len(self._preloaded[path]) == 1 and
+                 self._preloaded[path][0] == path):
+                self._images[path] = self._load(path, path, 0)
+            else:
+                self._animations[path] = self._load_animation(path)
+
+    def get_scaled(self,
+                   surface: Surface,
+                   size: Tuple[int, int],
+                   smooth: bool = False) -> Surface:
+        """Get <surface> scaled to <size>, with transform.smoothscale if
+        <smooth> and with transform.scale otherwise. Scaled copies of loaded
+        images are shared by every caller. Other surfaces are cached by
+        identity, and the cache keeps them alive while they are in it.
+        """
+        size = (max(int(size[0]), 0), max(int(size[1]), 0))
+        asset_id, index = self._asset_ids.get(id(surface), (id(surface), 0))
+        key = (asset_id, index, size, "smooth" if smooth else "scale")
+
+        entry = self._scaled.get(key)
+        if(entry is not None and entry[1] is surface):
+            self._hits += 1
+            self._scaled.move_to_end(key)
+            return entry[0]
+
+        self._misses += 1
+        if(smooth and size[0] > 0 and size[1] > 0 and
+           surface.get_bytesize() in (3, 4)):
+            scaled = transform.smoothscale(surface, size)
+        else:
+            scaled = transform.scale(surface, size)
+
+        if(entry is not None):
+            self._remove_scaled(key)
+
+        memory = _memory(scaled)
+        if(memory <= self._scaled_budget):
+            self._scaled[key] = (scaled, surface)
+            self._scaled_memory += memory
+            self._evict(self._scaled_budget)
+
+        return scaled
+
+    def set_scaled_budget(self, budget: int) -> None:
+        """Set the number of bytes of pixel data the scaled surface cache may
+        hold, evicting the least recently used surfaces over <budget>.
+        """
+        self._scaled_budget = budget
+        self._evict(budget)
+
+    def get_cache_stats(self) -> CacheStats:
+        """Get the counters of the scaled surface cache."""
+        return CacheStats(self._hits, self._misses, self._evictions,
+                          len(self._scaled), self._scaled_memory,
+                          self._scaled_budget)
+
+    def get_use_count(self, path: str) -> int:
+        """Get the number of times the image or animation folder at <path>
+        was requested.
+        """
+        return self._uses.get(path, 0)
+
+    def get_load_count(self) -> int:
+        """Get the number of image, bundle and sound files read from the
+        disk.
+        """
+        return self._load_count
+
+    def get_memory_usage(self) -> int:
+        """Get the number of bytes of pixel data held by the loaded images.
+        """
+        surfaces = list(self._images.values())
+        for frames in self._animations.values():
+            surfaces.extend(frames)
+
+        return sum(_memory(surface) for surface in surfaces)
+
+    def clear(self) -> None:
+        """Forget every loaded and scaled image. Images that are still used
+        by components stay alive until those components are gone.
+        """
+        self._images.clear()
+        self._animations.clear()
+        self._asset_ids.clear()
+        self._scaled.clear()
+        self._scaled_memory = 0
+        self._text.clear()
+        self._text_memory = 0
+
+    def _is_loaded(self, path: str) -> bool:
+        """Return whether the asset at <path> is loaded."""
+        return path in self._images or path in self._animations or \
+            path in self._sounds
+
+    def _is_decoded(self, file: str) -> bool:
+        """Return whether the preloaded <file> is decoded or taken."""
+        future = self._decoding.get(file)
+        return future is None or future.done()
+
+    def _load_animation(self, folder_path: str) -> Tuple[Surface, ...]:
+        """Load the frames of the animation in <folder_path>, sorted by
+        filename in ascending order.
+        """
+        files = self._preloaded.get(folder_path)
+        if(files is None):
+            files = _get_animation_files(folder_path)
+
+        if(len(files) == 1 and files[0].endswith(BUNDLE_EXTENSION)):
+            # Frames already in the display's format are drawn straight from
+            # the memory map of the bundle
+            masks = Surface((1, 1), SRCALPHA).convert_alpha().get_masks()
+            return tuple(self._register(frame, folder_path, index)
+                         if frame.get_masks() == masks
+                         else self._convert(frame, folder_path, index)
+                         for index, frame in
+                         enumerate(self._decode_file(files[0])))
+
+        return tuple(self._convert(self._decode_file(file), folder_path, index)
+                     for index, file in enumerate(files))
+
+    def _load(self, path: str, asset_id: str, index: int) -> Surface:
+        """Decode the image file at <path>, or take it from the preloaded
+        files, and convert it for fast drawing. The image is the frame at
+        <index> of the asset <asset_id>.
+        """
+        return self._convert(self._decode_file(path), asset_id, index)
+
+    def _decode_file(self, path: str):
+        """Decode the file at <path>, or take it from the preloaded files.
+        """
+        future = self._decoding.pop(path, None)
+        if(future is None):
+            self._load_count += 1
+            return _decode(path)
+        return future.result()
+
+    def _convert(self, surface: Surface, asset_id: str, index: int) -> Surface:
+        """Convert the decoded <surface> for fast drawing. The image is the
+        frame at <index> of the asset <asset_id>.
+        """
+        return self._register(surface.convert_alpha(), asset_id, index)
+
+    def _register(self,
+                  surface: Surface,
+                  asset_id: str,
+                  index: int) -> Surface:
+        """Remember that <surface> is the frame at <index> of the asset
+        <asset_id>, so its scaled copies are shared.
+        """
+        self._asset_ids[id(surface)] = (asset_id, index)
+        return surface
+
+    def _evict(self, budget: int) -> None:
+        """Remove the least recently used scaled surfaces until the cache
+        holds at most <budget> bytes.
+        """
+        while(self._scaled_memory > budget):
+            self._remove_scaled(next(iter(self._scaled)))
+            self._evictions += 1
+
+    def _remove_scaled(self, key: Tuple) -> None:
+        """Remove the scaled surface at <key> from the cache."""
+        scaled, _ = self._scaled.pop(key)
+        self._scaled_memory -= _memory(scaled)
+
+    def _remove_text(self, key: Tuple) -> None:
+        """Remove the rendered text at <key> from the cache."""
+        rendered, _ = self._text.pop(key)
+        self._text_memory -= _memory(rendered)
+
+
+def _get_animation_files(folder_path: str) -> List[str]:
+    """Get the paths of the files to decode for the animation folder
+    <folder_path>, which is its bundle if it is up to date and its frames
+    sorted by filename otherwise.
+    """
+    if(is_bundle_current(folder_path)):
+        return [get_bundle_path(folder_path)]
+    return [f"{folder_path}/{filename}"
+            for filename in sorted(os.listdir(folder_path))]
+
+
+def _decode(path: str):
+    """Decode the sound, bundle or image file at <path>. May run on a worker
+    thread.
+    """
+    if(path.endswith(".wav")):
+        return mixer.Sound(path)
+    if(path.endswith(BUNDLE_EXTENSION)):
+        return read_bundle(path)
+    return image.load(path)
+
+
+def _memory(surface: Surface) -> int:
+    """Get the number of bytes of pixel data of <surface>."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
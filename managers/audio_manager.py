@@ -1,5 +1,7 @@
 import pygame
 
+from managers.asset_manager import AssetManager
+
 
 class AudioManager(object):
     """A Singleton that manages the audio of the game. The static instance
@@ -9,9 +11,9 @@ class AudioManager(object):
 
     === Private Attributes ===
         _canon_shot:
-            The cannon shot sound file.
+            The path of the cannon shot sound file.
         _ship_hit:
-            The sound file for when a ship is hit.
+            The path of the sound file for when a ship is hit.
         _music_volume:
             The volume of the music.
         _fx_volume:
@@ -19,22 +21,24 @@ class AudioManager(object):
     """
     instance = None
 
-    _canon_shot: pygame.mixer.Sound
-    _ship_hit: pygame.mixer.Sound
+    _canon_shot: str
+    _ship_hit: str
     _music_volume: float
     _fx_volume: float
 
     def __init__(self):
         """Create a new Audio Manager and setup the static instance variable.
-        This functionwill load all the audio files.
+        This function starts loading the sound effects on the AssetManager's
+        worker threads. The AssetManager must be created first.
         """
         if(AudioManager.instance is None):
             AudioManager.instance = self
 
         pygame.mixer.init()
         pygame.mixer.music.load('audio/backgroundMusic.wav')
-        self._canon_shot = pygame.mixer.Sound("audio/canonShot.wav")
-        self._ship_hit = pygame.mixer.Sound("audio/shipHit.wav")
+        self._canon_shot = "audio/canonShot.wav"
+        self._ship_hit = "audio/shipHit.wav"
+        AssetManager.instance.preload((self._canon_shot, self._ship_hit))
         self._music_volume = 1
         self._fx_volume = 1
         self.start()
@@ -47,12 +51,12 @@ class AudioManager(object):
     def shoot(self):
         """ Play the canon shot sound effect.
         """
-        self._canon_shot.play()
+        AssetManager.instance.get_sound(self._canon_shot).play()
 
     def ship_hit(self):
         """ Play the sound effect for a ship that just got hit.
         """
-        self._ship_hit.play()
+        AssetManager.instance.get_sound(self._ship_hit).play()
 
     def set_music_volume(self, value: float):
         """Set the volume of the music. Precondition: 0.0 <= value <= 1.0 """
@@ -68,8 +72,10 @@ class AudioManager(object):
         Precondition: 0.0 <= value <= 1.0
         """
         self._fx_volume = value
-        self._ship_hit.set_volume(self._fx_volume)
-        self._canon_shot.set_volume(self._fx_volume)
+        AssetManager.instance.get_sound(self._ship_hit).set_volume(
+            self._fx_volume)
+        AssetManager.instance.get_sound(self._canon_shot).set_volume(
+            self._fx_volume)
 
     def get_fx_volume(self):
         """Return the current music volume, which is between 0.0 and 1.0."""
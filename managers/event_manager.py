@@ -1,15 +1,17 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame
 
 from components.component import Component
+from components.hit_index import HitIndex
 import managers.scene_manager as sm
 
 
 class EventManager(object):
     """A Singleton that manages all pygame events. The static instance
     variable can be used to access this object. This class must be created
-    atleast once.
+    atleast once. Consecutive mouse motions are coalesced, so the component
+    under the mouse is found once for all of them, at the latest position.
 
     === Private Attributes ===
         _is_invalid:
@@ -21,6 +23,11 @@ class EventManager(object):
             The component that is currently recieves all events.
         _hovered_component:
             The component that the mouse is currently over.
+        _hit_index:
+            The index of the components of the scene root, used to find the
+            component at a position.
+        _hit_test_count:
+            The number of hit tests done by the current or last update.
     """
     instance = None
 
@@ -28,6 +35,8 @@ class EventManager(object):
     _pressed_button: int
     _focused_component: Component
     _hovered_component: Component
+    _hit_index: HitIndex
+    _hit_test_count: int
 
     def __init__(self) -> None:
         """Create a new EventManager and setup the static instance variable."""
@@ -38,6 +47,8 @@ class EventManager(object):
         self._pressed_button = -1
         self._focused_component = None
         self._hovered_component = None
+        self._hit_index = HitIndex()
+        self._hit_test_count = 0
 
     def get_focused_component(self) -> Component:
         """Get the currently focused component."""
@@ -51,6 +62,12 @@ class EventManager(object):
         """Blur the curretly focused component."""
         self._set_focused_component(None)
 
+    def get_hit_test_count(self) -> int:
+        """Get the number of times the component under the mouse was looked
+        up during the last update.
+        """
+        return self._hit_test_count
+
     def set_invalid(self) -> None:
         """Mark the EventManager to reset the hovered component next update
         cycle.
@@ -58,34 +75,43 @@ class EventManager(object):
         self._is_invalid = True
 
     def update(self) -> None:
-        if(self._is_invalid):
-            self._is_invalid = False
-            self._invalidate()
+        """Handle every queued pygame event. A run of mouse motions is handled
+        as one motion to the latest mouse position, just before the next
+        other event or at the end of the update.
+        """
+        self._hit_test_count = 0
+        needs_hit_test = self._is_invalid
+        self._is_invalid = False
+        is_dragged = False
 
         # Poll Events
         for event in pygame.event.get():
+            if(event.type == pygame.MOUSEMOTION and
+               sm.SceneManager.instance.get_root().is_enabled()):
+                needs_hit_test = True
+                is_dragged = self._pressed_button != -1
+                continue
+
+            if(needs_hit_test):
+                needs_hit_test = False
+                self._on_mouse_motion(is_dragged)
+                is_dragged = False
+
             if event.type == pygame.QUIT:
                 sm.SceneManager.instance.quit_game()
 
             elif(event.type == pygame.VIDEORESIZE):
-                sm.SceneManager.instance.set_screen_size((event.w, event.h))
+                sm.SceneManager.instance.set_screen_size((event.w, event.h),
+                                                         True)
 
             elif(not sm.SceneManager.instance.get_root().is_enabled()):
                 return
 
-            elif(event.type == pygame.MOUSEMOTION):
-                self._invalidate()
-
-                if(self._pressed_button != -1):
-                    if(self._focused_component is not None):
-                        self._focused_component._on_drag()
-
             elif(event.type == pygame.MOUSEBUTTONUP):
                 if((event.button == 1 or event.button == 3) and
                         self._pressed_button == event.button):
 
-                    hit = self._hit_test(
-                        event.pos, sm.SceneManager.instance.get_root())
+                    hit = self._hit_test(event.pos)
                     if(hit is self._focused_component):
                         self._focused_component._on_click(self._pressed_button)
                     else:
@@ -103,31 +129,35 @@ class EventManager(object):
                     self._focused_component._on_key_press(
                         event.key, event.unicode, event.mod)
 
+        if(needs_hit_test):
+            self._on_mouse_motion(is_dragged)
+
+    def _on_mouse_motion(self, is_dragged: bool) -> None:
+        """Reset the hovered component at the latest mouse position, and drag
+        the focused component if <is_dragged>.
+        """
+        self._invalidate()
+
+        if(is_dragged and self._focused_component is not None):
+            self._focused_component._on_drag()
+
     def _invalidate(self) -> None:
         """Reset the hovered component. Does nothing if the mouse is currently
         pressed.
         """
         if(self._pressed_button == -1):
             self._set_hovered_component(
-                self._hit_test(pygame.mouse.get_pos(),
-                               sm.SceneManager.instance.get_root()))
-
-    def _hit_test(self,
-                  pos: Tuple[int, int],
-                  component: Component) -> Component:
-        """Get which component is at postion <pos> starting from <component>"""
-
-        children = component.get_children()
-        for i in range(len(children) - 1, -1, -1):
+                self._hit_test(pygame.mouse.get_pos()))
 
-            hit = self._hit_test(pos, children[i])
-            if(hit is not None):
-                return hit
+    def _hit_test(self, pos: Tuple[int, int]) -> Optional[Component]:
+        """Get which component of the scene root is at postion <pos>"""
+        self._hit_test_count += 1
 
-        if(component.get_rect().collidepoint(pos) and component.is_enabled()):
-            return component
+        root = sm.SceneManager.instance.get_root()
+        if(self._hit_index.get_root() is not root):
+            self._hit_index.set_root(root)
 
-        return None
+        return self._hit_index.hit_test(pos)
 
     def _set_hovered_component(self, hovered_component: Component) -> None:
         """Set the hovered component. Does nothing if <hovered_component> is
@@ -1,6 +1,10 @@
+from collections import deque
 from players.player import Player
 from players.ship import Ship
-from typing import List, Tuple
+from engine.game import Game
+from engine.snapshot import save_game, load_game
+from engine.replay import ReplayWriter
+from typing import Deque, List, Optional, Tuple
 
 
 class GameManager(object):
@@ -17,6 +21,16 @@ class GameManager(object):
             The player object for player 2.
         _whosTurn:
             The currently active scene.
+        _game:
+            The headless game holding the rules and state of the match.
+        _turn_queue:
+            The players whose turns have to be started, in order.
+        _turns_per_frame:
+            The maximum number of queued turns started every update.
+        _replay_log:
+            The log every accepted shot is appended to, or None.
+        _replay_id:
+            The id of the current game in _replay_log.
     """
     instance = None
 
@@ -24,6 +38,11 @@ class GameManager(object):
     _player1: Player
     _player2: Player
     _whosTurn: Player
+    _game: Game
+    _turn_queue: Deque[Player]
+    _turns_per_frame: int
+    _replay_log: Optional[ReplayWriter]
+    _replay_id: int
 
     def __init__(self):
         """Create a new GameManager and setup the static instance variable."""
@@ -34,17 +53,33 @@ class GameManager(object):
         self._player1 = None
         self._player2 = None
         self._whosTurn = None
+        self._game = None
+        self._turn_queue = deque()
+        self._turns_per_frame = 1
+        self._replay_log = None
+        self._replay_id = -1
 
     def setup_game(self,
                    player1: Player,
                    player2: Player,
                    size: int = 10):
-        """Set the starting values for a new game."""
+        """Set the starting values for a new game on a <size> by <size> grid.
+        The players' boards must have the same size. Large grids, such as
+        1000 by 1000, are played on sparse boards whose memory only grows
+        with the number of ships and shots.
+        """
 
         self._size = size
         self._player1 = player1
         self._player2 = player2
         self._whosTurn = player1
+        self._game = Game(player1.get_board(), player2.get_board())
+        self._turn_queue.clear()
+        self._start_replay()
+
+    def start_game(self):
+        """Queue the turn of the player who moves first."""
+        self._turn_queue.append(self._whosTurn)
 
     def guess(self, player: Player, coordinate: Tuple[int, int]) -> int:
         """Make a guess for <player> at coordinate <coordinate>. Returns 1 if
@@ -54,15 +89,125 @@ class GameManager(object):
            player != self._whosTurn):
             return -1
 
-        result = self.other_player(self._whosTurn).hit(coordinate)
+        player_index = self._player_index(player)
+        result = self._game.guess(player_index, coordinate)
 
         if(result != -1):
+            if(self._replay_id != -1):
+                self._replay_log.record_shot(self._replay_id, player_index,
+                                             coordinate, result)
+                if(self._game.is_over()):
+                    self._replay_log.flush()
+
             self._whosTurn = self.other_player(self._whosTurn)
-            self._whosTurn.on_turn_started()
+            self._turn_queue.append(self._whosTurn)
             return result
 
         return -1
 
+    def save_game(self) -> bytes:
+        """Return a compact binary snapshot of the current game."""
+        return save_game(self._game)
+
+    def load_game(self,
+                  data: bytes,
+                  player1: Player,
+                  player2: Player) -> None:
+        """Resume the game stored in the snapshot <data> with <player1> and
+        <player2> taking over the saved boards. The turn of the player to
+        move is queued, so the game continues with start_game.
+        """
+        game = load_game(data)
+        player1.set_board(game.get_board(0), game.get_board(1))
+        player2.set_board(game.get_board(1), game.get_board(0))
+
+        self._size = game.get_size()
+        self._player1 = player1
+        self._player2 = player2
+        self._whosTurn = (player1, player2)[game.get_whos_turn()]
+        self._game = game
+        self._turn_queue.clear()
+        self._start_replay()
+
+    def set_replay_log(self, replay_log: Optional[ReplayWriter]) -> None:
+        """Append every game to <replay_log>, or stop logging if it is None.
+        A game in progress is logged from now on, starting with the shots
+        already taken in it, and so is a loaded game.
+        """
+        self._flush_replay()
+        self._replay_log = replay_log
+        if(self._game is not None):
+            self._start_replay()
+
+    def get_replay_log(self) -> Optional[ReplayWriter]:
+        """Get the log the accepted shots are appended to, or None."""
+        return self._replay_log
+
+    def get_replay_id(self) -> int:
+        """Get the id of the current game in the replay log, or -1 if it is
+        not logged.
+        """
+        return self._replay_id
+
+    def _start_replay(self) -> None:
+        """Log the start of the current game if there is a replay log. The
+        records of the game it replaces are written first.
+        """
+        self._flush_replay()
+        self._replay_id = -1
+        if(self._replay_log is not None):
+            self._replay_id = self._replay_log.start_game(self._game)
+
+    def _flush_replay(self) -> None:
+        """Write the buffered records of the replay log, if there is one."""
+        if(self._replay_log is not None):
+            self._replay_log.flush()
+
+    def quit(self) -> None:
+        """Write the buffered records of the replay log, so the current game
+        is not lost when the application closes.
+        """
+        self._flush_replay()
+
+    def run_turns(self, count: int) -> int:
+        """Start up to <count> queued turns, one after another. A computer
+        player's move queues the next turn instead of starting it, so this
+        never recurses. Returns the number of turns started.
+        """
+        started = 0
+        while(started < count and len(self._turn_queue) > 0 and
+              not self.is_game_over()):
+            self._turn_queue.popleft().on_turn_started()
+            started += 1
+
+        return started
+
+    def run_until_over(self) -> None:
+        """Start queued turns until the game ends or a player has to wait
+        for input, such as a human player.
+        """
+        while(self.run_turns(self._turns_per_frame) > 0):
+            pass
+
+    def update(self) -> None:
+        """Start the queued turns allowed for one frame and let the player
+        whose turn it is take a move that was computed in the background.
+        """
+        self.run_turns(self._turns_per_frame)
+
+        if(self._whosTurn is not None and not self.is_game_over()):
+            self._whosTurn.update()
+
+    def set_turns_per_frame(self, count: int) -> None:
+        """Set the maximum number of turns started every update, used to
+        fast forward games between computer players.
+        """
+        self._turns_per_frame = count
+
+    def get_turns_per_frame(self) -> int:
+        """Get the maximum number of turns started every update."""
+        return self._turns_per_frame
+
     def other_player(self, player: Player) -> Player:
         """Get the opponent of <player>."""
         if(player == self._player1):
@@ -73,19 +218,38 @@ class GameManager(object):
 
         return None
 
+    def _player_index(self, player: Player) -> int:
+        """Get the index of <player> in the headless game."""
+        if(player == self._player1):
+            return 0
+
+        return 1
+
+    def get_game(self) -> Game:
+        """Get the headless game holding the state of the match."""
+        return self._game
+
+    def is_game_over(self) -> bool:
+        """Return whether one of the players has sunk every enemy ship."""
+        return self._game is not None and self._game.is_over()
+
     def get_whos_turn(self) -> Player:
         """Get the player who currently has to make a move."""
         return self._whosTurn
 
     def is_valid_coordinate(self, coordinate: Tuple[int, int]):
         """Return true if <coordinate> is on the grid."""
-        return (0 <= coordinate[0] <= self._size) \
-            and (0 <= coordinate[1] <= self._size)
+        return (0 <= coordinate[0] < self._size) \
+            and (0 <= coordinate[1] < self._size)
 
     def square_clicked(self, coordinate: Tuple[int, int]):
         """Relay a square click to the currently playing player."""
         self._whosTurn.square_clicked(coordinate)
 
+    def get_size(self) -> int:
+        """Get the size of the playing grid."""
+        return self._size
+
     def get_player1(self) -> Player:
         """Get the player object for player 1."""
         return self._player1
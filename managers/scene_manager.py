@@ -1,19 +1,36 @@
-from typing import Tuple, List
+from collections import OrderedDict
+from typing import Dict, Tuple, List, Optional
+import logging
 import os
+import time
 
 import pygame
 
 import managers.event_manager as em
+import managers.game_manager as gm
+from managers.asset_manager import AssetManager
 from components.panel import Panel
 from components.style import Style
 from components.label import Label
 from components.component import Component
 from util.constants import DEFAULT_WINDOWED_MODE_SIZE, MINIMUM_SCREEN_SIZE
 
+from scene.scene import Scene
 from scene.game_scene import GameScene
 from scene.main_menu_scene import MainMenuScene
 from scene.settings_scene import SettingsScene
 
+# Reports the time to the first frame as a debug message, shown when the game
+# is started with python main.py --debug
+_logger = logging.getLogger(__name__)
+
+# The number of suspended scenes kept to be shown again
+SCENE_CACHE_SIZE = 4
+
+# The time in miliseconds the window size has to stay the same after the user
+# resized the window before components regenerate their images
+RESIZE_SETTLE_TIME = 200
+
 
 class SceneManager(object):
     """A Singleton that manages all scenes and tracks the appilcation's
@@ -40,7 +57,28 @@ class SceneManager(object):
         _active_scene_index:
             The currently active scene's index.
         _active_scene:
-            The currently active scene.
+            The currently active scene, or None while its assets load.
+        _active_components:
+            The components the active scene added to the root.
+        _active_screen_size:
+            The screen size the active scene was created at.
+        _scene_cache:
+            The suspended scenes, from least to most recently shown. Maps the
+            index of every suspended scene and the screen size it was created
+            at to the scene and the components it added to the root.
+        _is_loading:
+            Whether or not the active scene waits for its assets to load.
+        _loading_label:
+            A label that displays the loading progress of the active scene.
+        _start_time:
+            The time in seconds, from time.perf_counter, at which the
+            application started.
+        _time_to_first_frame:
+            The time in miliseconds from the start of the application until
+            the first frame was shown, or None before then.
+        _resize_time:
+            The time in seconds, from time.perf_counter, at which the user
+            last resized the window.
     """
     instance = None
 
@@ -52,13 +90,39 @@ class SceneManager(object):
     _running: bool
     _is_fullscreen: bool
     _active_scene_index: int
-    _active_scene: object
+    _active_scene: Optional[Scene]
+    _active_components: List[Component]
+    _active_screen_size: Tuple[int, int]
+    _scene_cache: Dict[Tuple[int, Tuple[int, int]],
+                       Tuple[Scene, List[Component]]]
+    _is_loading: bool
+    _loading_label: Label
+    _start_time: float
+    _time_to_first_frame: Optional[float]
+    _resize_time: float
 
-    def __init__(self) -> None:
-        """Create a new SceneManager and setup the static instance variable."""
+    def __init__(self, start_time: float = None) -> None:
+        """Create a new SceneManager and setup the static instance variable.
+        <start_time> is the time.perf_counter time at which the application
+        started, used to measure the time to the first frame. The time this
+        SceneManager is created is used if it is None. The assets of every
+        scene start loading on worker threads, so the first scene is shown
+        while they load.
+        """
         if(SceneManager.instance is None):
             SceneManager.instance = self
 
+        self._start_time = start_time
+        if(start_time is None):
+            self._start_time = time.perf_counter()
+        self._time_to_first_frame = None
+        self._resize_time = float("-inf")
+        self._is_loading = False
+        self._active_scene = None
+        self._active_components = []
+        self._active_screen_size = (0, 0)
+        self._scene_cache = OrderedDict()
+
         # Tell pygame to center the window
         os.environ['SDL_VIDEO_CENTERED'] = '1'
         pygame.font.init()
@@ -69,6 +133,9 @@ class SceneManager(object):
         self._scenes = [MainMenuScene, SettingsScene, GameScene]
         self._running = True
 
+        for scene in self._scenes:
+            AssetManager.instance.preload(scene.ASSETS)
+
         self._setup_screen()
 
         # Always visible components
@@ -84,13 +151,29 @@ class SceneManager(object):
                                   parent=self._root)
         self._rest_fps_counter_position()
 
+        self._loading_label = Label(text="Loading",
+                                    rect=pygame.Rect(0, 0, 300, 50),
+                                    style=Style(
+                                        background_color=None,
+                                        border_width=0,
+                                        primary_color=(255, 255, 255)))
+        self._reset_loading_label_position()
+
         # Start the game
         self.change_scene(0)
         self._run_game_loop()
 
-    def set_screen_size(self, size: Tuple[int, int]) -> None:
-        """Set the screen size. This method re-creates the active scene."""
+    def set_screen_size(self,
+                        size: Tuple[int, int],
+                        is_resizing: bool = False) -> None:
+        """Set the screen size. The active scene's components are moved and
+        resized to fit the screen. <is_resizing> is whether the user is
+        resizing the window, in which case components wait until the size
+        settles before regenerating their images.
+        """
         em.EventManager.instance.set_invalid()
+        if(is_resizing):
+            self._resize_time = time.perf_counter()
         if (self._is_fullscreen):
             self._screen_size = (0, 0)
         else:
@@ -99,7 +182,11 @@ class SceneManager(object):
         self._setup_screen()
         self._root.set_rect(self._screen.get_rect())
         self._rest_fps_counter_position()
-        self.change_scene(self._active_scene_index)
+        self._reset_loading_label_position()
+
+        if(self._active_scene is not None):
+            self._active_scene.relayout(self._screen_size)
+            self._active_screen_size = self._screen_size
 
     def _setup_screen(self) -> None:
         """Create the screen object."""
@@ -134,6 +221,19 @@ class SceneManager(object):
         fps_rect.right = self._screen_size[0] - 25
         self._fps_counter.set_rect(fps_rect)
 
+    def _reset_loading_label_position(self):
+        """Center the loading label on the screen."""
+        loading_rect = self._loading_label.get_rect()
+        loading_rect.center = self._root.get_rect().center
+        self._loading_label.set_rect(loading_rect)
+
+    def is_resizing(self) -> bool:
+        """Return whether the user resized the window within the last
+        RESIZE_SETTLE_TIME miliseconds.
+        """
+        return time.perf_counter() - self._resize_time < \
+            RESIZE_SETTLE_TIME / 1000
+
     def get_screen_size(self) -> Tuple[int, int]:
         """Get the size of the screen in pixels."""
         return self._screen_size
@@ -142,14 +242,76 @@ class SceneManager(object):
         """Get the topmost component."""
         return self._root
 
+    def get_time_to_first_frame(self) -> Optional[float]:
+        """Get the time in miliseconds from the start of the application
+        until the first frame was shown, or None before then.
+        """
+        return self._time_to_first_frame
+
     def change_scene(self, scene_index: int) -> None:
-        """Switch the current scene to the scene at index <scene_index>."""
+        """Switch the current scene to the scene at index <scene_index>. A
+        cacheable scene that was shown recently at the same screen size is
+        resumed instead of created again. A loading screen is shown until the
+        scene's assets are loaded.
+        """
+        self._suspend_active_scene()
         self._root.clear_children()
         self._active_scene_index = scene_index
-        self._active_scene = self._scenes[scene_index](self._root)
+        self._active_scene = None
+        self._active_components = []
+
+        cached = self._scene_cache.pop((scene_index, self._screen_size), None)
+        assets = self._scenes[scene_index].ASSETS
+        AssetManager.instance.preload(assets)
+        self._is_loading = cached is None and \
+            not AssetManager.instance.is_ready(assets)
+
+        if(self._is_loading):
+            self._show_progress()
+            self._root.add_child(self._loading_label)
+        elif(cached is not None):
+            self._active_scene, self._active_components = cached
+            for component in self._active_components:
+                self._root.add_child(component)
+            self._active_scene.resume()
+        else:
+            self._active_scene = self._scenes[scene_index](self._root)
+            self._active_components = list(self._root.get_children())
+        self._active_screen_size = self._screen_size
+
         self._root.add_child(self._fps_counter)
         em.EventManager.instance.set_invalid()
 
+    def _suspend_active_scene(self) -> None:
+        """Keep the active scene to be shown again if it is cacheable,
+        forgetting the least recently shown scenes over SCENE_CACHE_SIZE.
+        """
+        if(self._active_scene is None or
+           not self._active_scene.IS_CACHEABLE):
+            return
+
+        self._active_scene.suspend()
+        key = (self._active_scene_index, self._active_screen_size)
+        self._scene_cache[key] = (self._active_scene, self._active_components)
+        while(len(self._scene_cache) > SCENE_CACHE_SIZE):
+            self._scene_cache.popitem(last=False)
+
+    def _update_loading(self) -> None:
+        """Create the active scene once its assets are loaded, and show the
+        loading progress until then.
+        """
+        assets = self._scenes[self._active_scene_index].ASSETS
+        if(AssetManager.instance.is_ready(assets)):
+            self.change_scene(self._active_scene_index)
+        else:
+            self._show_progress()
+
+    def _show_progress(self) -> None:
+        """Show the loading progress of the active scene's assets."""
+        progress = AssetManager.instance.get_progress(
+            self._scenes[self._active_scene_index].ASSETS)
+        self._loading_label.set_text(f"Loading {int(progress * 100)}%")
+
     def quit_game(self) -> None:
         """Close the application."""
         self._running = False
@@ -161,6 +323,11 @@ class SceneManager(object):
             em.EventManager.instance.update()
 
             # Update
+            AssetManager.instance.update()
+            if(self._is_loading):
+                self._update_loading()
+
+            gm.GameManager.instance.update()
             self._root.update(self._clock.tick())  # Framerate Limit
             if(self._clock.get_fps() != float("inf")):
                 self._fps_counter.set_text(str(int(self._clock.get_fps())))
@@ -172,4 +339,11 @@ class SceneManager(object):
             self._root.render(self._screen, changed)
             pygame.display.update(changed)
 
+            if(self._time_to_first_frame is None):
+                self._time_to_first_frame = \
+                    (time.perf_counter() - self._start_time) * 1000
+                _logger.debug("Time to first frame: %.0f ms",
+                              self._time_to_first_frame)
+
+        gm.GameManager.instance.quit()
         pygame.quit()
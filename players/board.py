@@ -0,0 +1,319 @@
+from typing import Dict, List, Set, Tuple
+import re
+
+from players.ship import Ship
+
+# Matches the bytes of a bit-plane that have a bit set
+_NONZERO_BYTE = re.compile(b"[^\\x00]")
+
+
+class Board(object):
+    """The grid belonging to one player in the Battleships game. It records
+    where that player's fleet is and every shot the opponent has taken at it.
+
+    Every cell is a bit of a python integer, the cell (x, y) being bit
+    y * size + x. Resolving a shot, rejecting a repeated shot and detecting a
+    sunken ship are all constant time and never scan the grid or the fleet.
+
+    === Private Attributes ===
+        _size:
+            The width and height of the grid.
+        _ships:
+            A List of the ships on this board.
+        _ship_at:
+            Maps the bit index of every occupied cell to the index of the
+            ship in _ships that occupies it.
+        _fleet_mask:
+            A bitmask of every cell occupied by a ship.
+        _hit_mask:
+            A bitmask of every cell that was shot and hit a ship.
+        _miss_mask:
+            A bitmask of every cell that was shot and missed.
+        _ships_left:
+            The number of ships on this board that are not sunk.
+    """
+
+    _size: int
+    _ships: List[Ship]
+    _ship_at: Dict[int, int]
+    _fleet_mask: int
+    _hit_mask: int
+    _miss_mask: int
+    _ships_left: int
+
+    def __init__(self, size: int = 10) -> None:
+        """Create an empty board of <size> by <size> cells."""
+        self._size = size
+        self._ships = []
+        self._ship_at = {}
+        self._fleet_mask = 0
+        self._hit_mask = 0
+        self._miss_mask = 0
+        self._ships_left = 0
+
+    def add_ship(self, ship: Ship) -> None:
+        """Place <ship> on the board.
+        Precondition: <ship> is on the board and does not overlap another
+        ship.
+        """
+        ship_index = len(self._ships)
+        self._ships.append(ship)
+        for coordinate in ship.get_coordinates():
+            index = self.index(coordinate)
+            self._ship_at[index] = ship_index
+            self._mark_fleet(index)
+
+        if(not ship.is_sunk()):
+            self._ships_left += 1
+
+    def shoot(self, coordinate: Tuple[int, int]) -> int:
+        """Take a shot at <coordinate>. Returns 0 if the shot misses, 1 if it
+        hits a ship, 2 if it sinks a ship and -1 if the coordinate is off the
+        board or has already been shot.
+        """
+        if(not self.is_valid_coordinate(coordinate)):
+            return -1
+
+        index = self.index(coordinate)
+        if(self._was_shot(index)):
+            return -1
+
+        ship_index = self._ship_at.get(index)
+        if(ship_index is None):
+            self._mark_miss(index)
+            return 0
+
+        result = self._ships[ship_index].hit(coordinate)
+        if(result == -1):
+            return -1
+
+        self._mark_hit(index)
+        if(result == 2):
+            self._ships_left -= 1
+
+        return result
+
+    def restore_shots(self, hit_plane: bytes, miss_plane: bytes) -> None:
+        """Record the shots in the bit-planes <hit_plane> and <miss_plane>
+        without resolving them one by one, such as when a saved game is
+        loaded. A bit-plane holds the bits of a mask in little endian order.
+        Precondition: no shots have been taken at this board and every hit
+        is on a ship.
+        """
+        self._hit_mask = int.from_bytes(hit_plane, "little")
+        self._miss_mask = int.from_bytes(miss_plane, "little")
+        self._restore_ships(_indices(self._hit_mask))
+
+    def restore_shot_indices(self,
+                             hits: List[int],
+                             misses: List[int]) -> None:
+        """Record the shots at the bit indices <hits> and <misses> without
+        resolving them one by one, such as when a saved game is loaded.
+        Precondition: no shots have been taken at this board and every hit
+        is on a ship.
+        """
+        self._hit_mask = _to_mask(hits)
+        self._miss_mask = _to_mask(misses)
+        self._restore_ships(hits)
+
+    def _restore_ships(self, hits: List[int]) -> None:
+        """Mark the ship cells at the bit indices <hits> as hit and recount
+        the ships that are left.
+        """
+        for index in hits:
+            self._ships[self._ship_at[index]].hit(self.coordinate(index))
+
+        self._ships_left = sum(not ship.is_sunk() for ship in self._ships)
+
+    def is_shot(self, coordinate: Tuple[int, int]) -> bool:
+        """Return whether <coordinate> has already been shot at."""
+        return self._was_shot(self.index(coordinate))
+
+    def _was_shot(self, index: int) -> bool:
+        """Return whether the cell at bit index <index> has been shot."""
+        return bool((self._hit_mask | self._miss_mask) >> index & 1)
+
+    def _mark_fleet(self, index: int) -> None:
+        """Record that a ship occupies the cell at bit index <index>."""
+        self._fleet_mask |= 1 << index
+
+    def _mark_hit(self, index: int) -> None:
+        """Record a hit on the cell at bit index <index>."""
+        self._hit_mask |= 1 << index
+
+    def _mark_miss(self, index: int) -> None:
+        """Record a miss on the cell at bit index <index>."""
+        self._miss_mask |= 1 << index
+
+    def is_valid_coordinate(self, coordinate: Tuple[int, int]) -> bool:
+        """Return true if <coordinate> is on the board."""
+        return (0 <= coordinate[0] < self._size) \
+            and (0 <= coordinate[1] < self._size)
+
+    def index(self, coordinate: Tuple[int, int]) -> int:
+        """Return the bit index of the cell at <coordinate>."""
+        return int(coordinate[1]) * self._size + int(coordinate[0])
+
+    def coordinate(self, index: int) -> Tuple[int, int]:
+        """Return the coordinate of the cell at bit index <index>."""
+        return (index % self._size, index // self._size)
+
+    def get_size(self) -> int:
+        """Return the width and height of the board."""
+        return self._size
+
+    def get_ships(self) -> List[Ship]:
+        """Return the List of ships on this board."""
+        return self._ships
+
+    def get_ships_left(self) -> int:
+        """Return the number of ships on this board that are not sunk."""
+        return self._ships_left
+
+    def is_defeated(self) -> bool:
+        """Return whether every ship on this board has been sunk."""
+        return self._ships_left == 0
+
+    def get_fleet_mask(self) -> int:
+        """Return the bitmask of every cell occupied by a ship."""
+        return self._fleet_mask
+
+    def get_hit_mask(self) -> int:
+        """Return the bitmask of every shot that hit a ship."""
+        return self._hit_mask
+
+    def get_miss_mask(self) -> int:
+        """Return the bitmask of every shot that missed."""
+        return self._miss_mask
+
+    def get_shots(self) -> List[Tuple[int, int, bool]]:
+        """Return the location of every shot taken at this board and whether
+        it hit, ordered by bit index.
+        """
+        return [self.coordinate(index) + (bool(self._hit_mask >> index & 1),)
+                for index in _indices(self._hit_mask | self._miss_mask)]
+
+    def get_shot_count(self) -> int:
+        """Return the number of shots taken at this board."""
+        return bin(self._hit_mask | self._miss_mask).count("1")
+
+
+class SparseBoard(Board):
+    """A Board for very large grids. A python integer with a bit per cell
+    costs memory and time in proportion to the area of the board, so the
+    shots are kept in hash sets instead. Memory grows with the number of
+    ships and shots, and every operation stays constant time no matter how
+    large the board is.
+
+    === Private Attributes ===
+        _hits:
+            The bit indices of every cell that was shot and hit a ship.
+        _misses:
+            The bit indices of every cell that was shot and missed.
+    """
+
+    _hits: Set[int]
+    _misses: Set[int]
+
+    def __init__(self, size: int) -> None:
+        """Create an empty board of <size> by <size> cells."""
+        Board.__init__(self, size)
+        self._hits = set()
+        self._misses = set()
+
+    def restore_shots(self, hit_plane: bytes, miss_plane: bytes) -> None:
+        """Record the shots in the bit-planes <hit_plane> and <miss_plane>
+        without resolving them one by one, such as when a saved game is
+        loaded. Empty bytes of the planes are skipped.
+        Precondition: no shots have been taken at this board and every hit
+        is on a ship.
+        """
+        self.restore_shot_indices(_plane_indices(hit_plane),
+                                  _plane_indices(miss_plane))
+
+    def restore_shot_indices(self,
+                             hits: List[int],
+                             misses: List[int]) -> None:
+        """Record the shots at the bit indices <hits> and <misses> without
+        resolving them one by one, such as when a saved game is loaded.
+        Precondition: no shots have been taken at this board and every hit
+        is on a ship.
+        """
+        self._hits = set(hits)
+        self._misses = set(misses)
+        self._restore_ships(hits)
+
+    def _was_shot(self, index: int) -> bool:
+        """Return whether the cell at bit index <index> has been shot."""
+        return index in self._hits or index in self._misses
+
+    def _mark_fleet(self, index: int) -> None:
+        """Ships are only recorded in _ship_at."""
+        pass
+
+    def _mark_hit(self, index: int) -> None:
+        """Record a hit on the cell at bit index <index>."""
+        self._hits.add(index)
+
+    def _mark_miss(self, index: int) -> None:
+        """Record a miss on the cell at bit index <index>."""
+        self._misses.add(index)
+
+    def get_fleet_mask(self) -> int:
+        """Return the bitmask of every cell occupied by a ship. This builds
+        an integer as large as the board.
+        """
+        return _to_mask(self._ship_at)
+
+    def get_hit_mask(self) -> int:
+        """Return the bitmask of every shot that hit a ship. This builds an
+        integer as large as the board.
+        """
+        return _to_mask(self._hits)
+
+    def get_miss_mask(self) -> int:
+        """Return the bitmask of every shot that missed. This builds an
+        integer as large as the board.
+        """
+        return _to_mask(self._misses)
+
+    def get_shots(self) -> List[Tuple[int, int, bool]]:
+        """Return the location of every shot taken at this board and whether
+        it hit, ordered by bit index.
+        """
+        return [self.coordinate(index) + (index in self._hits,)
+                for index in sorted(self._hits | self._misses)]
+
+    def get_shot_count(self) -> int:
+        """Return the number of shots taken at this board."""
+        return len(self._hits) + len(self._misses)
+
+
+def _to_mask(indices) -> int:
+    """Return a bitmask with the bits at <indices> set."""
+    plane = bytearray(max(indices, default=-1) // 8 + 1)
+    for index in indices:
+        plane[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(plane, "little")
+
+
+def _indices(mask: int) -> List[int]:
+    """Return the indices of the set bits of <mask> in ascending order."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+def _plane_indices(plane: bytes) -> List[int]:
+    """Return the indices of the set bits of the bit-plane <plane>."""
+    indices = []
+    for match in _NONZERO_BYTE.finditer(plane):
+        byte = plane[match.start()]
+        for bit in range(8):
+            if(byte >> bit & 1):
+                indices.append(match.start() * 8 + bit)
+
+    return indices
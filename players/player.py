@@ -1,8 +1,12 @@
+from random import Random
 from typing import List, Tuple
 
 from players.ship import Ship
+from players.board import Board
+from engine.game import DEFAULT_SHIP_LENGTHS, random_fleet
 import managers.game_manager as gm
 from util.observable import Observable
+from util.events import ShotResolved, TurnChanged
 import managers.audio_manager as am
 
 
@@ -16,10 +20,9 @@ class Player(Observable):
             The number of enemy ships that this player has sunk
         _num_of_ships:
             The total num of players ship
-        _ships:
-            A List of this players ships
-        _remaining_ships:
-            The number of ships this player has that are not sunk
+        _board:
+            The board holding this players ships and the shots taken at
+            them
         _guesses:
             A list that records the locations of any shots made
             (regardless of hit or miss)
@@ -28,16 +31,17 @@ class Player(Observable):
     _name: str
     _sunken_ships: int
     _num_of_ships: int
-    _ships: List[Ship]
-    _remaining_ships: int
+    _board: Board
     _guesses: List[Tuple[int, int, bool]]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, size: int = 10):
+        """Create a player named <name> with a random fleet on a <size> by
+        <size> board. Boards wider than SPARSE_BOARD_SIZE are sparse.
+        """
         Observable.__init__(self)
 
         self._name = name
-        self._ships = [Ship([(0, 0), (1, 1)])]
-        self._remaining_ships = len(self._ships)
+        self._board = random_fleet(size, DEFAULT_SHIP_LENGTHS, Random())
         self._sunken_ships = 0
         self.num_of_ships = 6
         self._guesses = []
@@ -51,34 +55,41 @@ class Player(Observable):
     def guess(self, coordinate: Tuple[int, int]) -> int:
         """Called by a player's sqaure_clicked. Takes a shot at the given
         <coordinate>, resulting in either a Hit, Miss, or Sinking an enemy
-        ship.
+        ship. Repeated shots are rejected by the enemy's board.
         """
-        for guess in self._guesses:
-            if(guess[:2] == coordinate):
-                return -1
-
         result = gm.GameManager.instance.guess(self, coordinate)
         if(result == 0):
-            print(self._name, "Miss")
             self._guesses.append((coordinate[0], coordinate[1], False))
-            am.AudioManager.instance.shoot()
+            self._play_sound(False)
 
         elif(result == 1):
-            print(self._name, "Hit")
             self._guesses.append((coordinate[0], coordinate[1], True))
-            am.AudioManager.instance.ship_hit()
+            self._play_sound(True)
 
         elif(result == 2):
-            print(self._name, "SUNK")
             self._guesses.append((coordinate[0], coordinate[1], True))
             self._sunken_ships += 1
-            am.AudioManager.instance.ship_hit()
+            self._play_sound(True)
         else:
             return -1
 
-        self.notify_observers()
+        self.notify_observers(ShotResolved(self, coordinate, result))
+        self.notify_observers(
+            TurnChanged(gm.GameManager.instance.get_whos_turn()))
         return result
 
+    def _play_sound(self, hit: bool):
+        """Plays the sound effect for a shot that <hit> or missed. Does
+        nothing when no AudioManager was created, such as in headless games.
+        """
+        if(am.AudioManager.instance is None):
+            return
+
+        if(hit):
+            am.AudioManager.instance.ship_hit()
+        else:
+            am.AudioManager.instance.shoot()
+
     def get_guesses(self) -> List[Tuple[int, int, bool]]:
         """Returns the List of this player's guesses.
         """
@@ -87,7 +98,22 @@ class Player(Observable):
     def get_ships(self) -> List[Ship]:
         """Returns the List of this player's ships.
         """
-        return self._ships
+        return self._board.get_ships()
+
+    def get_board(self) -> Board:
+        """Returns the board holding this player's ships.
+        """
+        return self._board
+
+    def set_board(self, board: Board, enemy_board: Board):
+        """Replaces this player's board with <board>, such as when a saved
+        game is loaded. The player's guesses are the shots already taken at
+        <enemy_board>.
+        """
+        self._board = board
+        self._guesses = enemy_board.get_shots()
+        self._sunken_ships = sum(ship.is_sunk()
+                                 for ship in enemy_board.get_ships())
 
     def on_turn_started(self):
         """Called at the start of a player's turn.
@@ -95,6 +121,12 @@ class Player(Observable):
         """
         pass
 
+    def update(self):
+        """Called once per frame while it is this player's turn.
+        To be implemented in sub classes.
+        """
+        pass
+
     def get_name(self) -> str:
         """Returns the players name.
         """
@@ -123,20 +155,16 @@ class Player(Observable):
     def get_ships_left(self) -> int:
         """Return the number of ships that have not been sunk by enemy.
         """
-        return self._remaining_ships
+        return self._board.get_ships_left()
 
     def decrement_remaining_ships(self):
-        """Decrease how many remaining ships this player has left, by one.
+        """Kept for callers of the old API. The board counts the ships that
+        are left as they sink, so this does nothing.
         """
-        if self._remaining_ships > 0:
-            self._remaining_ships -= 1
+        pass
 
     def hit(self, coordinate: Tuple[int, int]) -> int:
         """Returns whether the a players ship is at <coordinate> and if a shot
         at <coordinate> would be a hit, miss, or sink a ship.
         """
-        for ship in self._ships:
-            result = ship.hit(coordinate)
-            if(result != 0):
-                return result
-        return 0
+        return self._board.shoot(coordinate)
@@ -1,40 +1,201 @@
+from queue import Empty, Queue
+from random import Random
+from threading import Thread
+from typing import List, Tuple
+import time
+
+from players.board import Board
 from players.player import Player
-from players.ship import Ship
-from random import randint
+from engine.strategy import Strategy, ProbabilityStrategy, RandomStrategy
+import managers.game_manager as gm
 
 
 class PlayerComputer(Player):
-    """A Computer player in the battleships game.
+    """A Computer player in the battleships game. When threaded, the strategy
+    thinks on a worker thread and the move is delivered back to the main loop
+    through a queue, so the game keeps rendering while the computer thinks.
+
+    === Private Attributes ===
+        _strategy:
+            The strategy that chooses this player's shots.
+        _is_strategy_ready:
+            Whether or not the strategy was reset for the current game.
+        _is_threaded:
+            Whether or not the strategy runs on a worker thread.
+        _time_budget:
+            The time in miliseconds the strategy may think before a random
+            shot is taken instead.
+        _moves:
+            The queue through which the worker thread delivers its moves.
+        _is_thinking:
+            Whether or not a move was requested from the worker thread and has
+            not been taken out of _moves yet. The strategy is only used by the
+            main thread while this is False.
+        _is_waiting:
+            Whether or not it is this player's turn and no shot was taken yet.
+        _turn_start_time:
+            The time in miliseconds when this player started waiting.
+        _pending_results:
+            The results of random shots taken while the strategy was
+            thinking, to be given to the strategy once it is done.
+        _random_shots:
+            Draws the cells of the random shots without repeating a cell,
+            so a random shot never scans the board for an unshot cell.
     """
+    _strategy: Strategy
+    _is_strategy_ready: bool
+    _is_threaded: bool
+    _time_budget: float
+    _moves: Queue
+    _is_thinking: bool
+    _is_waiting: bool
+    _turn_start_time: float
+    _pending_results: List[Tuple[Tuple[int, int], int]]
+    _random_shots: RandomStrategy
+
+    def __init__(self,
+                 name: str,
+                 size: int = 10,
+                 strategy: Strategy = None,
+                 threaded: bool = True,
+                 time_budget: float = 1000):
+        """Create a computer player named <name> that picks its shots with
+        <strategy>. A ProbabilityStrategy is used if <strategy> is None.
+        <threaded> is whether the strategy runs on a worker thread, in which
+        case a random shot is taken if it thinks for longer than
+        <time_budget> miliseconds. Headless games that are driven by
+        GameManager.run_until_over should not be threaded.
+        """
+        Player.__init__(self, name, size)
+
+        if(strategy is None):
+            strategy = ProbabilityStrategy()
+
+        self._strategy = strategy
+        self._is_strategy_ready = False
+        self._is_threaded = threaded
+        self._time_budget = time_budget
+        self._moves = Queue()
+        self._is_thinking = False
+        self._is_waiting = False
+        self._turn_start_time = 0
+        self._pending_results = []
+        self._random_shots = RandomStrategy()
 
     def on_turn_started(self):
-        """On computer players turn, makes a random shot at enemy's grid
+        """On computer players turn, makes a shot at enemy's grid chosen by
+        the strategy. When threaded, the shot is taken by a later update.
         """
-        # if(len(self._guesses) > 0):
-        randomX = randint(0, 9)
-        randomY = randint(0, 9)
-        while self.guess((randomX, randomY)) == -1:
-            randomX = randint(0, 9)
-            randomY = randint(0, 9)
-
-    def get_possible_moves(self, row, col):
-        """Checks the coordinates surrounding <row> and <col>, returning a
-        list that contains the [row, col] of moves that can be made
+        if(not self._is_strategy_ready):
+            self._is_strategy_ready = True
+            opponent = gm.GameManager.instance.other_player(self)
+            self._strategy.reset(
+                self._board.get_size(),
+                [ship.get_length() for ship in opponent.get_ships()],
+                Random())
+            self._random_shots.reset(self._board.get_size(), [], Random())
+
+        if(not self._is_threaded):
+            coordinate = self._strategy.next_shot()
+            result = self.guess(coordinate)
+            self._strategy.on_result(coordinate, result)
+            return
+
+        self._wait_for_move()
+
+    def update(self):
+        """Take the shot chosen by the worker thread if it is ready, or a
+        random shot if the strategy ran out of time.
         """
-        pass
+        if(not self._is_waiting):
+            return
+
+        try:
+            coordinate = self._moves.get_nowait()
+        except Empty:
+            elapsed = time.perf_counter() * 1000 - self._turn_start_time
+            if(elapsed > self._time_budget):
+                self._take_random_shot()
+            return
+
+        self._is_thinking = False
+        self._is_waiting = False
+        self._give_pending_results()
+
+        result = self.guess(coordinate)
+        self._strategy.on_result(coordinate, result)
 
-    def is_sunk(self):
-        """Returns True if the ship is sunk
+        if(result == -1 and not gm.GameManager.instance.is_game_over()):
+            self._wait_for_move()
+
+    def set_board(self, board: Board, enemy_board: Board):
+        """Replaces this player's board with <board> and tells the strategy
+        about the shots already taken at <enemy_board>. A snapshot does not
+        record the order of the shots, so every other shot is given first
+        and then one cell of each sunk ship is given as the shot that sunk
+        it, once the rest of that ship is known to be hit.
         """
-        pass
+        Player.set_board(self, board, enemy_board)
+
+        self._is_strategy_ready = True
+        self._strategy.reset(
+            board.get_size(),
+            [ship.get_length() for ship in enemy_board.get_ships()],
+            Random())
+        self._random_shots.reset(board.get_size(), [], Random())
+
+        sinking_shots = [ship.get_coordinates()[-1]
+                         for ship in enemy_board.get_ships()
+                         if ship.is_sunk()]
+        sinking_cells = set(sinking_shots)
+        for x, y, hit in self._guesses:
+            if((x, y) not in sinking_cells):
+                self._strategy.on_result((x, y), int(hit))
 
-    def has_hit(self):
-        """Checks to see if the computer player currently has a hit enemy ship
+        for coordinate in sinking_shots:
+            self._strategy.on_result(coordinate, 2)
+
+    def get_strategy(self) -> Strategy:
+        """Returns the strategy that chooses this player's shots."""
+        return self._strategy
+
+    def _wait_for_move(self):
+        """Start waiting for a move, asking the worker thread for one unless
+        it is still working on a previous request.
         """
-        pass
+        self._is_waiting = True
+        self._turn_start_time = time.perf_counter() * 1000
+
+        if(not self._is_thinking):
+            self._is_thinking = True
+            self._give_pending_results()
+            Thread(target=self._think, daemon=True).start()
 
-    def get_hit(self):
-        """Returns the coordinates: [row, col], of a shot that has hit an enemy
-        ship
+    def _think(self):
+        """Ask the strategy for a move and deliver it to the main thread.
+        Runs on a worker thread.
         """
-        pass
+        self._moves.put(self._strategy.next_shot())
+
+    def _give_pending_results(self):
+        """Tell the strategy the results of the random shots it missed."""
+        for coordinate, result in self._pending_results:
+            self._strategy.on_result(coordinate, result)
+        self._pending_results.clear()
+
+    def _take_random_shot(self):
+        """Shoot at a random cell that has not been shot. The move the
+        strategy is still working on will be used next turn instead. Every
+        cell is drawn at most once a game, so the cells shot by the strategy
+        are skipped in constant time on average while most of the board is
+        unshot.
+        """
+        opponent_board = gm.GameManager.instance.other_player(
+            self).get_board()
+
+        coordinate = self._random_shots.next_shot()
+        while(opponent_board.is_shot(coordinate)):
+            coordinate = self._random_shots.next_shot()
+
+        self._is_waiting = False
+        self._pending_results.append((coordinate, self.guess(coordinate)))
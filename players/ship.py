@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 
 class Ship(object):
@@ -6,14 +6,23 @@ class Ship(object):
     A ship object in the Batleships game.
 
     === Private Attributes ===
-        _hit_points:
-            A list of the ships hit points
-            (The locations on the grid the ship takes up)
+        _coordinates:
+            The locations on the grid the ship takes up, in the order they
+            were given.
+        _offsets:
+            Maps each location the ship takes up to its bit in _hit_mask.
+        _hit_mask:
+            A bitmask with a set bit for every location that has been hit.
+        _sunk_mask:
+            The value of _hit_mask once every location has been hit.
         _ship_length:
             The number of spots on the grid, that the ship takes up
     """
 
-    _hit_points: List[Tuple[int, int, bool]]
+    _coordinates: List[Tuple[int, int]]
+    _offsets: Dict[Tuple[int, int], int]
+    _hit_mask: int
+    _sunk_mask: int
     _ship_length: int
 
     def __init__(self, coordinates: List[Tuple[int, int]]) -> None:
@@ -21,43 +30,53 @@ class Ship(object):
         one or more locations.
         coordinates needs to be formed as [(x1,x2), (y1,y2), ...]
         """
-        self._hit_points = []
+        self._coordinates = []
+        self._offsets = {}
         for coordinate in coordinates:
-            self._hit_points.append((coordinate[0], coordinate[1], False))
-        self._ship_length = len(coordinates)
+            point = (int(coordinate[0]), int(coordinate[1]))
+            self._offsets[point] = len(self._coordinates)
+            self._coordinates.append(point)
+
+        self._ship_length = len(self._coordinates)
+        self._hit_mask = 0
+        self._sunk_mask = (1 << self._ship_length) - 1
 
     def hit(self, coordinate: Tuple[int, int]) -> int:
         """Checks to see if the given <coordinate> is the location of part of
         this ship.
         Returns whether <coordinate> is a hit, miss, or sink, on ship
         """
-        for i in range(len(self._hit_points)):
-            point = self._hit_points[i]
+        offset = self._offsets.get((coordinate[0], coordinate[1]))
+        if(offset is None):
+            return 0  # Ship miss
+
+        bit = 1 << offset
+        if(self._hit_mask & bit):  # Invalid move
+            return -1
 
-            if(point[0] == coordinate[0] and point[1] == coordinate[1]):
-                if(point[2]):  # Invalid move
-                    return -1
+        self._hit_mask |= bit
 
-                self._hit_points[i] = (point[0], point[1], True)
+        if(self.is_sunk()):  # Ship sunk
+            return 2
 
-                if(self.is_sunk()):  # Ship sunk
-                    return 2
+        return 1    # Ship hit
 
-                return 1    # Ship hit
+    def get_coordinates(self) -> List[Tuple[int, int]]:
+        """Returns the locations on the grid this ship takes up."""
+        return self._coordinates
 
-        return 0  # Ship miss
+    def get_length(self) -> int:
+        """Returns the number of spots on the grid this ship takes up."""
+        return self._ship_length
 
     def get_hit_points(self) -> List[Tuple]:
         """Returns a list of this ships hit points
         (coordinates of the ship on the grid)
         """
-        return self._hit_points
+        return [(point[0], point[1], bool(self._hit_mask >> i & 1))
+                for i, point in enumerate(self._coordinates)]
 
     def is_sunk(self) -> bool:
         """Returns whether or not every spot on the ship is hit
         """
-        for i in range(len(self._hit_points)):
-            if(not self._hit_points[i][2]):
-                return False
-
-        return True
+        return self._hit_mask == self._sunk_mask
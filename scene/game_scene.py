@@ -16,11 +16,15 @@ from components.background_water import BackgroundWater
 import managers.scene_manager as sm
 import managers.event_manager as em
 from managers.game_manager import GameManager
+from managers.asset_manager import AssetManager
+from players.player import Player
 from util.observer import Observer
+from util.events import Event, ShotResolved, TurnChanged
 from components.pause_menu_panel import PauseMenuPanel
+from scene.scene import Scene
 
 
-class GameScene(Observer):
+class GameScene(Scene, Observer):
     """The in game view.
 
     === Private Attributes ===
@@ -36,6 +40,13 @@ class GameScene(Observer):
     _background_water: BackgroundWater
     _pause_menu: PauseMenuPanel
 
+    # The images the scene needs, loaded before it is created
+    ASSETS = ("images/water", "images/boat", "images/hit", "images/miss",
+              "images/pause.jpg")
+
+    # Every game scene starts a new game, so it is never shown again
+    IS_CACHEABLE = False
+
     def __init__(self, root: Panel):
         """Create a new GameScene, creating the gui components to
         display and starting the game.
@@ -53,9 +64,7 @@ class GameScene(Observer):
                              border_width=1)
 
         size = root.get_rect().size
-
-        rect1 = Rect(size[0]/8, size[1]/8, size[0] * 3 / 8, size[1] * 3 / 4)
-        rect2 = Rect(size[0]/2, size[1]/8, size[0] * 3 / 8, size[1] * 3 / 4)
+        rect1, rect2 = self._get_grid_rects(size)
 
         # The background water for the game
         self._background_water = BackgroundWater(
@@ -67,7 +76,7 @@ class GameScene(Observer):
             force_parent_redraw=True,
             border_color=(0, 0, 0),
             border_width=2,
-            background_image=pygame.image.load(
+            background_image=AssetManager.instance.get_image(
                 "images/pause.jpg"))
 
         # Pause Button
@@ -110,9 +119,29 @@ class GameScene(Observer):
 
         # Start the game
         current_player = GameManager.instance.get_whos_turn()
-        current_player.on_turn_started()
+        GameManager.instance.start_game()
         current_player.notify_observers()
 
+    def relayout(self, size: Tuple[int, int]) -> None:
+        """Resize the water and the pause menu to a screen of <size>, and
+        move the grids. The game and the grids' tiles are kept.
+        """
+        self._background_water.set_rect(Rect(0, 0, size[0], size[1]))
+        self._pause_menu.set_rect(self._background_water.get_rect())
+
+        rect1, rect2 = self._get_grid_rects(size)
+        for grid in self._player1_grids:
+            grid.set_rect(rect1)
+        for grid in self._player2_grids:
+            grid.set_rect(rect2)
+
+    def _get_grid_rects(self, size: Tuple[int, int]) -> Tuple[Rect, Rect]:
+        """Get the rectangles of the player 1 and player 2 grids on a screen
+        of <size>.
+        """
+        return (Rect(size[0]/8, size[1]/8, size[0] * 3 / 8, size[1] * 3 / 4),
+                Rect(size[0]/2, size[1]/8, size[0] * 3 / 8, size[1] * 3 / 4))
+
     def _create_player_grids(self, rect: Rect, style: Style) -> \
             Tuple[AnimatedGrid, AnimatedGrid, AnimatedGrid]:
         """Create a ship grid, hit grid, and miss grid. The function returns
@@ -126,21 +155,32 @@ class GameScene(Observer):
                               border_width=0,
                               force_parent_redraw=True)
 
+        size = GameManager.instance.get_size()
+
         # A grid of boats
         ships = AnimatedGrid(rect=rect,
                              folder_path="images/boat",
+                             horizontal_tile_count=size,
+                             vertical_tile_count=size,
+                             atlas=True,
                              style=style,
                              parent=self._background_water)
 
         # A grid of hits
         hits = AnimatedGrid(rect=rect,
                             folder_path="images/hit",
+                            horizontal_tile_count=size,
+                            vertical_tile_count=size,
+                            atlas=True,
                             style=overlay_style,
                             parent=ships)
 
         # A grid of misses
         misses = AnimatedGrid(rect=rect,
                               folder_path="images/miss",
+                              horizontal_tile_count=size,
+                              vertical_tile_count=size,
+                              atlas=True,
                               style=overlay_style,
                               parent=hits)
 
@@ -150,35 +190,65 @@ class GameScene(Observer):
         """Open the pause menu."""
         self._pause_menu.set_parent(self._background_water)
 
-    def on_notify(self) -> None:
-        """Update the animated grids when the player makes a move."""
-        current_player = GameManager.instance.get_whos_turn()
-        player1 = GameManager.instance.get_player1()
-        player2 = GameManager.instance.get_player2()
+    def on_notify(self, event: Event = None) -> None:
+        """Update the animated grids when a player makes a move. Only the tile
+        that was shot is drawn after a shot, and only the ship grid that is
+        shown and the click callbacks change when the turn passes.
+        Everything is rebuilt if <event> is None.
+        """
+        if(isinstance(event, ShotResolved)):
+            self._on_shot_resolved(event)
+        elif(isinstance(event, TurnChanged)):
+            self._on_turn_changed(event.player)
+        else:
+            self._refresh()
+
+    def _on_shot_resolved(self, event: ShotResolved) -> None:
+        """Draw the hit or miss of the shot in <event> on the opponent's
+        grids.
+        """
+        if(event.player is GameManager.instance.get_player1()):
+            grids = self._player2_grids
+        else:
+            grids = self._player1_grids
 
-        player1_ships = []
-        player2_ships = []
+        tile = (event.coordinate[0], event.coordinate[1])
+        if(event.result == 0):
+            grids[2].add_tile(tile)
+        else:
+            grids[1].add_tile(tile)
 
-        # Setup the current player
-        if(current_player is player1):
-            player1_ships = player1.get_ships()
-            self._player1_grids[2]._on_click_callback = None
+    def _on_turn_changed(self, current_player: Player) -> None:
+        """Show the ships of <current_player> and let them click on the
+        opponent's grid. The ship tiles are only hidden or shown, so this
+        does not depend on the size of the fleets.
+        """
+        is_player1 = current_player is GameManager.instance.get_player1()
+
+        self._player1_grids[0].set_tiles_visible(is_player1)
+        self._player2_grids[0].set_tiles_visible(not is_player1)
 
+        if(is_player1):
+            self._player1_grids[2]._on_click_callback = None
             self._player2_grids[2]._on_click_callback = \
                 GameManager.instance.square_clicked
         else:
-            player2_ships = player2.get_ships()
-
             self._player1_grids[2]._on_click_callback = \
                 GameManager.instance.square_clicked
-
             self._player2_grids[2]._on_click_callback = None
 
+    def _refresh(self) -> None:
+        """Rebuild every animated grid from the state of the game."""
+        player1 = GameManager.instance.get_player1()
+        player2 = GameManager.instance.get_player2()
+
         # Ships
         self._player1_grids[0].set_tiles(
-            self.ships_to_list(player1_ships))
+            self.ships_to_list(player1.get_ships()))
         self._player2_grids[0].set_tiles(
-            self.ships_to_list(player2_ships))
+            self.ships_to_list(player2.get_ships()))
+
+        self._on_turn_changed(GameManager.instance.get_whos_turn())
 
         # Hits
         self._player1_grids[1].set_tiles(
@@ -196,8 +266,7 @@ class GameScene(Observer):
         """Convert a list of ships into a list of coordinates."""
         lst = []
         for ship in ships:
-            for point in ship.get_hit_points():
-                lst.append(point)
+            lst.extend(ship.get_coordinates())
 
         return lst
 
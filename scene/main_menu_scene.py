@@ -1,4 +1,5 @@
-import pygame
+from typing import Tuple
+
 from pygame import Rect, Surface
 
 from components.panel import Panel
@@ -9,72 +10,104 @@ from components.slider import Slider
 from components.textbox import Textbox
 from components.vertical_panel import VerticalPanel
 import managers.scene_manager as sm
+from managers.asset_manager import AssetManager
 from managers.game_manager import GameManager
 from players.playerHuman import PlayerHuman
 from players.playerComputer import PlayerComputer
+from scene.scene import Scene
+
+
+class MainMenuScene(Scene):
+    """A menu menu for the game.
 
+    === Private Attributes ===
+        _title_label:
+            The label that displays the game's title.
+        _options_panel:
+            The panel that lays out the menu options.
+    """
+    _title_label: Label
+    _options_panel: VerticalPanel
 
-class MainMenuScene(object):
-    """A menu menu for the game."""
+    # The images the scene needs, loaded before it is created
+    ASSETS = ()
+
+    # Nothing in the menu changes, so it is shown again as it was
+    IS_CACHEABLE = True
 
     def __init__(self, root: Panel):
         """Create a new MainMenuScene, creating the gui components to
         display.
         """
         size = root.get_rect().size
-        title_rect = Rect(0, 0, 500, 70)
-        title_rect.center = (size[0] / 2, size[1] / 2 - 200)
 
         # A panel for all the options
-        options_panel = VerticalPanel(rect=Rect(size[0] / 4, size[1] / 2,
-                                                size[0] / 2, size[1] / 4),
-                                      expand_height=False,
-                                      parent=root)
+        self._options_panel = VerticalPanel(
+            rect=self._get_options_rect(size),
+            expand_height=False,
+            parent=root)
 
         # Title label
-        Label(text="BATTLE SHIP!",
-              rect=title_rect,
-              style=Style(background_color=None,
-                          border_width=0,
-                          font=pygame.font.Font(
-                              'freesansbold.ttf', 64),
-                          primary_color=(255, 255, 255)),
-              parent=root)
+        self._title_label = Label(
+            text="BATTLE SHIP!",
+            rect=self._get_title_rect(size),
+            style=Style(background_color=None,
+                        border_width=0,
+                        font=AssetManager.instance.get_font(
+                            'freesansbold.ttf', 64),
+                        primary_color=(255, 255, 255)),
+            parent=root)
 
         # A style for all of the menu options
         button_style = Style(primary_color=(255, 255, 255),
                              background_color=(128, 0, 0),
                              border_width=1,
                              border_color=(0, 0, 0),
-                             font=pygame.font.Font('freesansbold.ttf', 32))
+                             font=AssetManager.instance.get_font(
+                                 'freesansbold.ttf', 32))
 
         # Player vs Computer button
         Button(rect=Rect(0, 0, 400, 40),
                on_click=self._pvc_clicked,
                text="Player vs Computer",
                style=button_style,
-               parent=options_panel)
+               parent=self._options_panel)
 
         # Player vs Player button
         Button(rect=Rect(0, 0, 400, 40),
                on_click=self._pvp_clicked,
                text="Player vs Player",
                style=button_style,
-               parent=options_panel)
+               parent=self._options_panel)
 
         # Settings button
         Button(rect=Rect(0, 0, 400, 40),
                on_click=self._settings_clicked,
                text="Settings",
                style=button_style,
-               parent=options_panel)
+               parent=self._options_panel)
 
         # Quit button
         Button(rect=Rect(0, 0, 400, 40),
                on_click=self._quit_clicked,
                text="Quit",
                style=button_style,
-               parent=options_panel)
+               parent=self._options_panel)
+
+    def relayout(self, size: Tuple[int, int]) -> None:
+        """Center the title and the options on a screen of <size>."""
+        self._title_label.set_rect(self._get_title_rect(size))
+        self._options_panel.set_rect(self._get_options_rect(size))
+
+    def _get_title_rect(self, size: Tuple[int, int]) -> Rect:
+        """Get the rectangle of the title on a screen of <size>."""
+        title_rect = Rect(0, 0, 500, 70)
+        title_rect.center = (size[0] / 2, size[1] / 2 - 200)
+        return title_rect
+
+    def _get_options_rect(self, size: Tuple[int, int]) -> Rect:
+        """Get the rectangle of the options on a screen of <size>."""
+        return Rect(size[0] / 4, size[1] / 2, size[0] / 2, size[1] / 4)
 
     def _pvc_clicked(self, button: int):
         """Start a new game of player vs computer."""
@@ -0,0 +1,30 @@
+from typing import Tuple
+
+
+class Scene(object):
+    """A base class for all scenes. A scene creates its components under the
+    root when it is created. The SceneManager keeps cacheable scenes after
+    switching away from them, and shows them again by resuming them instead
+    of creating them again.
+    """
+
+    # The images the scene needs, loaded before it is created
+    ASSETS = ()
+
+    # Whether or not the scene can be suspended and shown again later
+    IS_CACHEABLE = False
+
+    def relayout(self, size: Tuple[int, int]) -> None:
+        """Move and resize the scene's components to fit a screen of <size>.
+        """
+        pass
+
+    def suspend(self) -> None:
+        """Called when the scene stops being shown and is kept for later."""
+        pass
+
+    def resume(self) -> None:
+        """Called when a kept scene is shown again, to update anything that
+        changed while it was suspended.
+        """
+        pass
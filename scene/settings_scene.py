@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import pygame
 from pygame import event
 from pygame import Rect, Surface
@@ -13,20 +15,46 @@ from components.panel import Panel
 from components.horizontal_panel import HorizontalPanel
 from components.vertical_panel import VerticalPanel
 import managers.audio_manager as am
+from managers.asset_manager import AssetManager
+from scene.scene import Scene
 
 
-class SettingsScene(object):
+class SettingsScene(Scene):
     """ The settings menu in Battleships. This menu allows user to
     adjust the sound fx, music volume, switch to full screen,
     and they can return to main menu.
     """
 
+    # The images the scene needs, loaded before it is created
+    ASSETS = ("images/left-arrow-icon.png",)
+
+    # The window mode is updated when the menu is shown again
+    IS_CACHEABLE = True
+
     def __init__(self, root: Component):
         self.create_panels(root)
         self.create_labels(root)
         self.create_buttons(root)
         self.create_sliders(root)
 
+    def relayout(self, size: Tuple[int, int]) -> None:
+        """Center the options and the title on a screen of <size>, and show
+        the current window mode.
+        """
+        self.options_panel.set_rect(self._get_options_rect(size))
+
+        title_rect = self.menu.get_rect()
+        title_rect.centerx = size[0]/2
+        self.menu.set_rect(title_rect)
+
+        self.fullscreen_button.set_text(self._get_window_mode_text())
+
+    def resume(self) -> None:
+        """Show the current window mode, which changes when the menu is
+        shown again at another screen size.
+        """
+        self.fullscreen_button.set_text(self._get_window_mode_text())
+
     def create_buttons(self, root: Component) -> None:
         """Create all buttons in the settings menu"""
 
@@ -36,12 +64,13 @@ class SettingsScene(object):
                              border_width=1)
 
         size = sm.SceneManager.instance.get_screen_size()
+        back_image = AssetManager.instance.get_image(
+            "images/left-arrow-icon.png")
         self.back_button = Button(on_click=self._open_main_menu,
                                   rect=Rect(20, 20, 100, 100),
                                   style=Style(
                                       background_color=(255, 0, 0),
-                                      background_image=pygame.image.load(
-                                          "images/left-arrow-icon.png")),
+                                      background_image=back_image),
                                   parent=root)
 
         self.fullscreen_button = Button(on_click=self._toggle_fullscreen,
@@ -52,8 +81,7 @@ class SettingsScene(object):
 
     def create_panels(self, root: Component):
         size = sm.SceneManager.instance.get_screen_size()
-        self.options_panel = VerticalPanel(rect=Rect(size[0]/4, size[1]/4,
-                                                     size[0] / 2, size[1] / 2),
+        self.options_panel = VerticalPanel(rect=self._get_options_rect(size),
                                            expand_height=False,
                                            parent=root)
 
@@ -113,6 +141,10 @@ class SettingsScene(object):
             style=slider_style,
             parent=self.music_panel)
 
+    def _get_options_rect(self, size: Tuple[int, int]) -> Rect:
+        """Get the rectangle of the options on a screen of <size>."""
+        return Rect(size[0]/4, size[1]/4, size[0] / 2, size[1] / 2)
+
     def _toggle_fullscreen(self, button: int) -> None:
         """Toggle the window mode between fullscreen and windowed."""
         sm.SceneManager.instance.toggle_fullscreen()
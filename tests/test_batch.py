@@ -0,0 +1,72 @@
+from random import Random
+import unittest
+
+# The managers have to be imported before the players, as in main.py
+from managers.game_manager import GameManager
+from players.player import Player
+from engine.batch import BatchGame
+from engine.game import Game, random_fleet
+
+
+def random_shots(rng: Random, games: int, size: int):
+    """Return lists of x and y coordinates for one shot in each of <games>
+    games, including shots one cell off every side of a <size> by <size>
+    board.
+    """
+    xs = [rng.randrange(-1, size + 1) for _ in range(games)]
+    ys = [rng.randrange(-1, size + 1) for _ in range(games)]
+    return xs, ys
+
+
+class BatchGameTest(unittest.TestCase):
+    """Plays the same random shots through a BatchGame and through scalar
+    games, and checks that every result and winner is the same.
+    """
+
+    def test_matches_game(self):
+        rng = Random(290)
+        size = 6
+        games = [Game(random_fleet(size, [3, 2, 2], rng),
+                      random_fleet(size, [3, 2, 2], rng))
+                 for _ in range(200)]
+        batch = BatchGame.from_boards([(game.get_board(0), game.get_board(1))
+                                       for game in games])
+
+        # Small boards make repeated shots common
+        for _ in range(150):
+            xs, ys = random_shots(rng, len(games), size)
+            results = batch.step(xs, ys)
+            for i, game in enumerate(games):
+                result = game.guess(game.get_whos_turn(), (xs[i], ys[i]))
+                self.assertEqual(int(results[i]), result)
+
+        self.assertEqual([int(winner) for winner in batch.get_winners()],
+                         [-1 if game.get_winner() is None
+                          else game.get_winner() for game in games])
+        self.assertTrue(batch.is_over().any())
+
+    def test_matches_game_manager(self):
+        rng = Random(2019)
+        manager = GameManager.instance
+        if(manager is None):
+            manager = GameManager()
+
+        for _ in range(5):
+            player1 = Player("player 1")
+            player2 = Player("player 2")
+            batch = BatchGame.from_boards([(player1.get_board(),
+                                            player2.get_board())])
+            manager.setup_game(player1, player2)
+
+            while(not manager.is_game_over()):
+                xs, ys = random_shots(rng, 1, manager.get_size())
+                result = manager.guess(manager.get_whos_turn(),
+                                       (xs[0], ys[0]))
+                self.assertEqual(int(batch.step(xs, ys)[0]), result)
+
+            self.assertEqual(int(batch.get_winners()[0]),
+                             manager.get_game().get_winner())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+from collections import Counter
+from random import Random
+import unittest
+
+from engine.placements import PlacementIndex
+
+
+class RandomFleetTest(unittest.TestCase):
+    """Random fleets drawn from a PlacementIndex."""
+
+    def test_fleets_are_uniform(self):
+        index = PlacementIndex(3, (2, 2))
+        rng = Random(8)
+        counts = Counter(
+            tuple(tuple(ship.get_coordinates())
+                  for ship in index.random_fleet(rng).get_ships())
+            for _ in range(44000))
+
+        # Two ships of length 2 can be placed 88 ways on a 3 by 3 board, so
+        # each fleet is expected about 500 times
+        self.assertEqual(len(counts), 88)
+        self.assertGreater(min(counts.values()), 400)
+        self.assertLess(max(counts.values()), 600)
+
+    def test_ship_too_long(self):
+        with self.assertRaises(ValueError):
+            PlacementIndex(10, (11,)).random_fleet(Random(0))
+
+    def test_fleet_too_large(self):
+        with self.assertRaises(ValueError):
+            PlacementIndex(5, (5,) * 6).random_fleet(Random(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
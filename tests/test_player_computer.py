@@ -0,0 +1,87 @@
+import unittest
+
+# The managers have to be imported before the players, as in main.py
+from managers.game_manager import GameManager
+from players.board import Board
+from players.ship import Ship
+from players.playerComputer import PlayerComputer
+from engine.game import Game
+from engine.snapshot import save_game
+
+
+def make_board(ships) -> Board:
+    """Return a 10 by 10 board holding a ship on each list of <ships>."""
+    board = Board(10)
+    for cells in ships:
+        board.add_ship(Ship(cells))
+    return board
+
+
+class LoadedGameTest(unittest.TestCase):
+    """A computer player resuming a saved game where it has sunk a ship and
+    wounded another.
+    """
+
+    def setUp(self):
+        if(GameManager.instance is None):
+            GameManager()
+
+        own = make_board([[(0, 9), (1, 9)]])
+        enemy = make_board([[(2, 2), (3, 2), (4, 2)],
+                            [(7, 5), (7, 6), (7, 7), (7, 8)],
+                            [(0, 0), (1, 0)]])
+        for coordinate in ((4, 2), (2, 2), (3, 2), (7, 6), (5, 5)):
+            enemy.shoot(coordinate)
+
+        self.computer = PlayerComputer("computer", threaded=False)
+        opponent = PlayerComputer("opponent", threaded=False)
+        GameManager.instance.load_game(save_game(Game(own, enemy)),
+                                       self.computer, opponent)
+        self.strategy = self.computer.get_strategy()
+
+    def test_sunk_ship_is_resolved(self):
+        self.assertNotIn(3, self.strategy._lengths_left)
+        self.assertEqual(sorted(self.strategy._lengths_left), [2, 4])
+        self.assertEqual(self.strategy._hits, {6 * 10 + 7})
+
+    def test_hunts_after_the_wounded_ship_sinks(self):
+        self.strategy.on_result((7, 5), 1)
+        self.strategy.on_result((7, 7), 1)
+        self.strategy.on_result((7, 8), 2)
+
+        self.assertEqual(self.strategy._hits, set())
+        self.assertEqual(self.strategy._lengths_left, [2])
+
+        sunk = {(x, 2) for x in range(2, 5)} | {(7, y) for y in range(5, 9)}
+        self.assertNotIn(self.strategy.next_shot(), sunk)
+
+
+class RandomShotTest(unittest.TestCase):
+    """The random shots a computer player takes when its strategy runs out
+    of time.
+    """
+
+    def test_random_shots_skip_shot_cells(self):
+        if(GameManager.instance is None):
+            GameManager()
+
+        computer = PlayerComputer("computer", threaded=False)
+        opponent = PlayerComputer("opponent", threaded=False)
+        GameManager.instance.setup_game(computer, opponent)
+        # The first turn resets the strategy and takes its shot
+        computer.on_turn_started()
+        opponent.on_turn_started()
+        enemy = opponent.get_board()
+
+        # Every random shot has to be accepted, until the game ends or only
+        # a few cells are left
+        while(enemy.get_shot_count() < 95 and
+              not GameManager.instance.is_game_over()):
+            count = enemy.get_shot_count()
+            computer._take_random_shot()
+            self.assertEqual(enemy.get_shot_count(), count + 1)
+            opponent.on_turn_started()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+from random import Random
+import os
+import shutil
+import tempfile
+import unittest
+
+# The managers have to be imported before the players, as in main.py
+from managers.game_manager import GameManager
+from players.board import Board
+from players.player import Player
+from players.ship import Ship
+from engine.game import Game, random_fleet
+from engine.replay import ReplayReader, ReplayWriter
+from engine.snapshot import save_game
+
+
+def random_game(rng: Random) -> Game:
+    """Return a new game on a 6 by 6 board with random fleets."""
+    return Game(random_fleet(6, [3, 2], rng), random_fleet(6, [3, 2], rng))
+
+
+class ReplayLogTest(unittest.TestCase):
+    """Writing games to a replay log and reading them back."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "games.replay")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_partial_record_is_truncated(self):
+        rng = Random(11)
+        writer = ReplayWriter(self.path)
+        first = writer.start_game(random_game(rng))
+        writer.record_shot(first, 0, (1, 1), 0)
+        writer.close()
+
+        # A crash in the middle of a write leaves part of a record
+        with open(self.path, "ab") as log:
+            log.write(b"\x07" * 9)
+
+        writer = ReplayWriter(self.path)
+        second = writer.start_game(random_game(rng))
+        writer.record_shot(second, 0, (2, 3), 1)
+        writer.close()
+
+        reader = ReplayReader(self.path)
+        self.assertEqual(second, first + 1)
+        self.assertEqual([(shot.x, shot.y) for shot in
+                          reader.get_shots(first)], [(1, 1)])
+        self.assertEqual([(shot.x, shot.y, shot.result) for shot in
+                          reader.get_shots(second)], [(2, 3, 1)])
+        reader.close()
+
+    def test_only_the_last_game_logs_shots(self):
+        rng = Random(12)
+        writer = ReplayWriter(self.path)
+        first = writer.start_game(random_game(rng))
+        writer.start_game(random_game(rng))
+
+        with self.assertRaises(ValueError):
+            writer.record_shot(first, 0, (0, 0), 0)
+        writer.close()
+
+
+class GameManagerReplayTest(unittest.TestCase):
+    """The replay log of the GameManager's games."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "games.replay")
+        self.manager = GameManager.instance
+        if(self.manager is None):
+            self.manager = GameManager()
+
+    def tearDown(self):
+        writer = self.manager.get_replay_log()
+        self.manager.set_replay_log(None)
+        if(writer is not None):
+            writer.close()
+        shutil.rmtree(self.folder)
+
+    def test_log_set_during_a_game(self):
+        player1 = Player("player 1")
+        player2 = Player("player 2")
+        self.manager.setup_game(player1, player2)
+        self.manager.set_replay_log(None)
+        self.assertNotEqual(self.manager.guess(player1, (0, 0)), -1)
+
+        writer = ReplayWriter(self.path)
+        self.manager.set_replay_log(writer)
+        self.assertNotEqual(self.manager.guess(player2, (0, 0)), -1)
+        self.assertIs(self.manager.get_whos_turn(), player1)
+
+        # Quitting writes the records of the game that is not over
+        self.manager.quit()
+
+        reader = ReplayReader(self.path)
+        game = reader.load_game(self.manager.get_replay_id())
+        self.assertEqual(reader.get_turn_count(
+            self.manager.get_replay_id()), 1)
+        self.assertEqual(game.get_board(0).get_shot_count(), 1)
+        self.assertEqual(game.get_board(1).get_shot_count(), 1)
+        self.assertEqual(game.get_whos_turn(), 0)
+        reader.close()
+
+    def test_loaded_game_keeps_its_shots(self):
+        board1 = Board(10)
+        board1.add_ship(Ship([(0, 0), (1, 0)]))
+        board2 = Board(10)
+        board2.add_ship(Ship([(5, 5), (5, 6)]))
+        board2.add_ship(Ship([(8, 1), (8, 2)]))
+        for coordinate in ((5, 5), (5, 6), (8, 1)):
+            board2.shoot(coordinate)
+        board1.shoot((3, 3))
+
+        writer = ReplayWriter(self.path)
+        self.manager.set_replay_log(writer)
+        self.manager.load_game(save_game(Game(board1, board2)),
+                               Player("player 1"), Player("player 2"))
+        self.manager.guess(self.manager.get_player1(), (8, 2))
+        self.assertTrue(self.manager.is_game_over())
+
+        reader = ReplayReader(self.path)
+        game_id = self.manager.get_replay_id()
+        self.assertEqual(reader.get_turn_count(game_id), 1)
+
+        loaded = reader.load_game(game_id, 0)
+        self.assertEqual(loaded.get_board(1).get_ships_left(), 1)
+        self.assertEqual(loaded.get_board(0).get_shot_count(), 1)
+        self.assertFalse(loaded.is_over())
+        self.assertTrue(reader.load_game(game_id).is_over())
+        reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+from random import Random
+import unittest
+
+from engine.game import Game, random_fleet
+from engine.snapshot import load_game, save_game
+
+
+def played_game(size: int, rng: Random) -> Game:
+    """Return a game on a <size> by <size> board where a ship was hit and
+    both players missed once.
+    """
+    game = Game(random_fleet(size, [5, 4, 3], rng),
+                random_fleet(size, [5, 4, 3], rng))
+    game.guess(0, game.get_board(1).get_ships()[0].get_coordinates()[0])
+    for coordinate in ((0, 0), (size - 1, size - 1), (1, 0)):
+        game.guess(game.get_whos_turn(), coordinate)
+    return game
+
+
+class SnapshotTest(unittest.TestCase):
+    """Saving games to snapshots and loading them back."""
+
+    def assertSameGame(self, first: Game, second: Game):
+        self.assertEqual(first.get_whos_turn(), second.get_whos_turn())
+        for player in range(2):
+            self.assertEqual(first.get_board(player).get_shots(),
+                             second.get_board(player).get_shots())
+            self.assertEqual(first.get_board(player).get_ships_left(),
+                             second.get_board(player).get_ships_left())
+
+    def test_round_trip(self):
+        game = played_game(10, Random(4))
+        self.assertSameGame(load_game(save_game(game)), game)
+
+    def test_sparse_size_follows_shots(self):
+        game = played_game(2000, Random(5))
+        data = save_game(game)
+        self.assertLess(len(data), 300)
+        self.assertSameGame(load_game(data), game)
+
+    def test_truncated_data(self):
+        for size in (10, 2000):
+            data = save_game(played_game(size, Random(size)))
+            for end in range(len(data)):
+                with self.assertRaises(ValueError):
+                    load_game(data[:end])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+from random import Random
+import unittest
+
+from engine.strategy import STRATEGIES, create_strategy
+
+
+class ExhaustedBoardTest(unittest.TestCase):
+    """Every registered strategy on a board where every cell was shot."""
+
+    def test_every_cell_is_shot_once_then_raises(self):
+        for name in STRATEGIES:
+            strategy = create_strategy(name)
+            strategy.reset(4, [2], Random(5))
+
+            shots = set()
+            for _ in range(16):
+                shot = strategy.next_shot()
+                shots.add(shot)
+                strategy.on_result(shot, 0)
+
+            self.assertEqual(len(shots), 16, name)
+            with self.assertRaises(ValueError, msg=name):
+                strategy.next_shot()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Pack the frames of an animation folder into a single bundle file of
+decoded pixels, so loading the animation is a memory map instead of one image
+decode per frame. Build the bundles of every animation in images/ from the
+repository root with: python -m util.asset_bundle
+"""
+from mmap import mmap, ACCESS_COPY
+from typing import List
+import os
+import struct
+import sys
+
+from pygame import Surface, image
+
+# Identifies a bundle and the version of its layout
+MAGIC = b"BBDL"
+VERSION = 1
+
+# The extension added to the path of an animation folder to get its bundle
+BUNDLE_EXTENSION = ".bundle"
+
+# The byte order of the pixels of every frame. This is the layout of the
+# display's alpha format on little endian machines, so the frames can be drawn
+# without being converted
+PIXEL_FORMAT = "BGRA"
+
+# magic, version, number of frames
+_HEADER = struct.Struct("<4sBxH")
+
+# width, height and offset in the file of the pixels of a frame
+_FRAME = struct.Struct("<IIQ")
+
+
+def get_bundle_path(folder_path: str) -> str:
+    """Get the path of the bundle of the animation folder <folder_path>."""
+    return folder_path.rstrip("/\\") + BUNDLE_EXTENSION
+
+
+def is_bundle_current(folder_path: str) -> bool:
+    """Return whether the animation folder <folder_path> has a bundle that is
+    newer than the folder and every file in it.
+    """
+    try:
+        bundle_time = os.stat(get_bundle_path(folder_path)).st_mtime
+    except OSError:
+        return False
+
+    if(os.stat(folder_path).st_mtime > bundle_time):
+        return False
+    return all(entry.stat().st_mtime <= bundle_time
+               for entry in os.scandir(folder_path))
+
+
+def build_bundle(folder_path: str) -> str:
+    """Decode the frames of the animation folder <folder_path>, sorted by
+    filename in ascending order, and write them to its bundle. Returns the
+    path of the bundle.
+
+    The bundle is a fixed header followed by the size and offset of every
+    frame, then the pixels of every frame as rows of PIXEL_FORMAT bytes.
+    """
+    frames = [image.load(f"{folder_path}/{filename}")
+              for filename in sorted(os.listdir(folder_path))]
+
+    offset = _HEADER.size + _FRAME.size * len(frames)
+    table = [_HEADER.pack(MAGIC, VERSION, len(frames))]
+    for frame in frames:
+        width, height = frame.get_size()
+        table.append(_FRAME.pack(width, height, offset))
+        offset += width * height * len(PIXEL_FORMAT)
+
+    # Written next to the bundle first, so a reader never sees half of it
+    bundle_path = get_bundle_path(folder_path)
+    temporary_path = bundle_path + ".tmp"
+    with open(temporary_path, "wb") as bundle:
+        bundle.write(b"".join(table))
+        for frame in frames:
+            bundle.write(image.tobytes(frame, PIXEL_FORMAT))
+    os.replace(temporary_path, bundle_path)
+
+    return bundle_path
+
+
+def read_bundle(bundle_path: str) -> List[Surface]:
+    """Get the frames stored in the bundle at <bundle_path>. The frames are
+    made directly on a copy on write memory map of the bundle without copying
+    the pixels, and keep the map open while they are alive. Raises a
+    ValueError if the file is not a bundle or was written by an unknown
+    version.
+    """
+    with open(bundle_path, "rb") as bundle:
+        data = mmap(bundle.fileno(), 0, access=ACCESS_COPY)
+
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if(magic != MAGIC):
+        raise ValueError(f"{bundle_path} is not an asset bundle")
+    if(version != VERSION):
+        raise ValueError(f"Unsupported asset bundle version {version}")
+
+    pixels = memoryview(data)
+    frames = []
+    for number in range(count):
+        width, height, offset = \
+            _FRAME.unpack_from(data, _HEADER.size + _FRAME.size * number)
+        end = offset + width * height * len(PIXEL_FORMAT)
+        frames.append(image.frombuffer(pixels[offset:end], (width, height),
+                                       PIXEL_FORMAT))
+
+    return frames
+
+
+if __name__ == '__main__':
+    folders = sys.argv[1:]
+    if(len(folders) == 0):
+        folders = [entry.path.replace(os.sep, "/")
+                   for entry in sorted(os.scandir("images"),
+                                       key=lambda entry: entry.name)
+                   if entry.is_dir()]
+
+    for folder in folders:
+        path = build_bundle(folder)
+        print(f"{path}: {os.path.getsize(path) / 2 ** 20:.1f} MiB")
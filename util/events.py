@@ -0,0 +1,21 @@
+from typing import NamedTuple, Tuple, Union
+
+from util.observable import Observable
+
+
+class ShotResolved(NamedTuple):
+    """Sent by <player> after its shot at <coordinate> was accepted. <result>
+    is 0 for a miss, 1 for a hit and 2 for a sink.
+    """
+    player: Observable
+    coordinate: Tuple[int, int]
+    result: int
+
+
+class TurnChanged(NamedTuple):
+    """Sent when it becomes <player>'s turn."""
+    player: Observable
+
+
+# An event passed to Observer.on_notify
+Event = Union[ShotResolved, TurnChanged]
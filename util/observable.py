@@ -16,10 +16,12 @@ class Observable(object):
         """Create a new Observable object."""
         self._observers = []
 
-    def notify_observers(self):
-        """Runs when the observed object notifies its observers."""
+    def notify_observers(self, event: object = None):
+        """Notify every observer of <event>, or that the observed object
+        changed in an unspecified way if <event> is None.
+        """
         for observer in self._observers:
-            observer.on_notify()
+            observer.on_notify(event)
 
     def add_observer(self, observer: Observer):
         """Add an observer to the collection."""
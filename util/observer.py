@@ -4,6 +4,9 @@ class Observer(object):
     """An inplementation of the observer class in the observer design pattern.
     """
 
-    def on_notify(self):
-        """Runs when the observed object notifies its observers."""
+    def on_notify(self, event: object = None):
+        """Runs when the observed object notifies its observers. <event>
+        describes what changed, such as an event from util.events, or is
+        None if the observer should refresh everything.
+        """
         pass